@@ -3,6 +3,7 @@ import sys
 import time
 import random
 import asyncio
+import logging
 import pyperclip
 from typing import Tuple, Any
 from utils.config_loader import load_settings
@@ -10,6 +11,8 @@ from modules.game_interaction import GameInteraction
 from modules.image_search import template_match, search_until_found, search_until_found_pixel, TemplateCache, count_template_matches
 from utils.adb_interaction import ADBInteraction
 
+logging.basicConfig(level=logging.INFO)
+
 class GameManager:
     def __init__(self, game, adb, device_name, device_id, log):
         """Initialize with an instance of GameInteraction."""
@@ -88,39 +91,39 @@ class GameManager:
 
     async def do_opening(self):
         # Restart game with data clearance
-        self.game.close_game(self.device_id)
-        self.game.delete_account(self.device_id)
+        await asyncio.to_thread(self.game.close_game, self.device_id)
+        await asyncio.to_thread(self.game.delete_account, self.device_id)
         await asyncio.sleep(2)
-        self.game.start_game(self.device_id)
+        await asyncio.to_thread(self.game.start_game, self.device_id)
 
         # Check title screen
         await self.find_and_tap("data/images/title.png", 5)
 
         # Enable speed mode
         await self.find_and_tap("data/images/mod.png", 1)
-        self.adb.simulate_swipe(self.device_id, 35, 260, 200, 260, duration=300)
+        await self.adb.simulate_swipe(self.device_id, 35, 260, 200, 260, duration=300)
         await self.find_and_tap("data/images/mod_minimize.png", 1)
 
         # Check birthday screen
         if not await search_until_found(self.adb, self.device_id, "data/images/birth_ok.png"):
-            print("Birth screen not found.")
+            logging.error("Birth screen not found.")
             return False
 
         # Set year
-        self.adb.simulate_tap(self.device_id, 150, 700)
+        await self.adb.simulate_tap(self.device_id, 150, 700)
         await asyncio.sleep(0.5)
-        self.adb.simulate_swipe(self.device_id, 150, 440, 150, 900, duration=200)
-        self.adb.simulate_tap(self.device_id, 150, 550)
+        await self.adb.simulate_swipe(self.device_id, 150, 440, 150, 900, duration=200)
+        await self.adb.simulate_tap(self.device_id, 150, 550)
         await asyncio.sleep(0.5)
 
         # Set month
-        self.adb.simulate_tap(self.device_id, 400, 700)
+        await self.adb.simulate_tap(self.device_id, 400, 700)
         await asyncio.sleep(0.5)
-        self.adb.simulate_tap(self.device_id, 400, 600)
+        await self.adb.simulate_tap(self.device_id, 400, 600)
         await asyncio.sleep(0.5)
 
         # Press OK
-        self.adb.simulate_tap(self.device_id, 270, 860)
+        await self.adb.simulate_tap(self.device_id, 270, 860)
         await asyncio.sleep(0.5)
 
         # Press OK again
@@ -133,58 +136,58 @@ class GameManager:
         await self.find_and_tap("data/images/term_x.png", 1)
 
         # Agree to terms and ok
-        self.adb.simulate_tap(self.device_id, 85, 645)
+        await self.adb.simulate_tap(self.device_id, 85, 645)
         await asyncio.sleep(0.2)
-        self.adb.simulate_tap(self.device_id, 85, 710)
+        await self.adb.simulate_tap(self.device_id, 85, 710)
         await asyncio.sleep(0.2)
-        self.adb.simulate_tap(self.device_id, 270, 860)
+        await self.adb.simulate_tap(self.device_id, 270, 860)
         await asyncio.sleep(0.2)
 
         # Set data usage
-        self.adb.simulate_tap(self.device_id, 160, 475)
+        await self.adb.simulate_tap(self.device_id, 160, 475)
         await asyncio.sleep(0.2)
-        self.adb.simulate_tap(self.device_id, 160, 610)
+        await self.adb.simulate_tap(self.device_id, 160, 610)
         await asyncio.sleep(0.2)
-        self.adb.simulate_tap(self.device_id, 160, 745)
+        await self.adb.simulate_tap(self.device_id, 160, 745)
         await asyncio.sleep(0.2)
-        self.adb.simulate_tap(self.device_id, 270, 865)
+        await self.adb.simulate_tap(self.device_id, 270, 865)
         await asyncio.sleep(0.5)
 
         # No sync
-        self.adb.simulate_tap(self.device_id, 260, 590)
+        await self.adb.simulate_tap(self.device_id, 260, 590)
         await asyncio.sleep(0.5)
-        self.adb.simulate_tap(self.device_id, 270, 820)
+        await self.adb.simulate_tap(self.device_id, 270, 820)
         await asyncio.sleep(2)
 
         # Check for movie
         if not await search_until_found_pixel(self.adb, self.device_id, (2, 2, 2), tolerance=3):
-            print("Movie screen not found.")
+            logging.error("Movie screen not found.")
             return False
 
         # Skip movie
-        self.adb.simulate_tap(self.device_id, 485, 900)
+        await self.adb.simulate_tap(self.device_id, 485, 900)
         await asyncio.sleep(0.1)
-        self.adb.simulate_tap(self.device_id, 485, 900)
+        await self.adb.simulate_tap(self.device_id, 485, 900)
         await asyncio.sleep(0.1)
-        self.adb.simulate_tap(self.device_id, 485, 900)
+        await self.adb.simulate_tap(self.device_id, 485, 900)
         await asyncio.sleep(0.1)
-        self.adb.simulate_tap(self.device_id, 485, 900)
+        await self.adb.simulate_tap(self.device_id, 485, 900)
         await asyncio.sleep(0.5)
 
 
-        self.adb.simulate_tap(self.device_id, 270, 770)
+        await self.adb.simulate_tap(self.device_id, 270, 770)
         await asyncio.sleep(0.3)
-        self.adb.simulate_tap(self.device_id, 400, 770)
+        await self.adb.simulate_tap(self.device_id, 400, 770)
         await asyncio.sleep(0.5)
         return True
 
     async def do_nickname(self):
         await self.find_and_tap("data/images/nickname.png", 1)
-        self.adb.simulate_tap(self.device_id, 260, 410)
+        await self.adb.simulate_tap(self.device_id, 260, 410)
         await asyncio.sleep(1)
         self.nickname = await self.get_random_nickname()
         self.log.emit(f"⏳ [인스턴스 {self.device_name}] 닉네임: {self.nickname} 설정 중...")
-        self.adb.simulate_string(self.device_id, self.nickname)
+        await self.adb.simulate_string(self.device_id, self.nickname)
         await asyncio.sleep(0.2)
 
         await self.find_and_tap("data/images/nick_ok1.png", 1)
@@ -194,43 +197,43 @@ class GameManager:
 
     async def do_firstpack(self):
         if not await search_until_found(self.adb, self.device_id, "data/images/firstpack.png"):
-            print("First pack screen not found.")
+            logging.error("First pack screen not found.")
             return False
 
         # Tap m2 pack
-        self.adb.simulate_tap(self.device_id, 260, 550)
+        await self.adb.simulate_tap(self.device_id, 260, 550)
         await asyncio.sleep(0.3)
-        self.adb.simulate_tap(self.device_id, 260, 750)
+        await self.adb.simulate_tap(self.device_id, 260, 750)
 
         if not await search_until_found(self.adb, self.device_id, "data/images/firstpack_open.png"):
-            print("First pack open screen not found.")
+            logging.error("First pack open screen not found.")
             return False
 
         # Open pack swiping
         for _ in range(5):
-            self.adb.simulate_swipe(self.device_id, 40, 550, 530, 550, duration=600)
+            await self.adb.simulate_swipe(self.device_id, 40, 550, 530, 550, duration=600)
             await asyncio.sleep(0.2)
 
         await asyncio.sleep(0.3)
 
         for _ in range(10):
-            self.adb.simulate_tap(self.device_id, 270, 400)
+            await self.adb.simulate_tap(self.device_id, 270, 400)
             await asyncio.sleep(0.1)
 
         if not await search_until_found(self.adb, self.device_id, "data/images/firstpack_swipe.png"):
-            print("First pack swipe screen not found.")
+            logging.error("First pack swipe screen not found.")
             return False
 
         for _ in range(5):
-            self.adb.simulate_swipe(self.device_id, 260, 800, 260, 40, duration=100)
+            await self.adb.simulate_swipe(self.device_id, 260, 800, 260, 40, duration=100)
             await asyncio.sleep(0.2)
 
         if not await search_until_found(self.adb, self.device_id, "data/images/firstpack_logo.png"):
-            print("First pack book screen not found.")
+            logging.error("First pack book screen not found.")
             return False
 
         for _ in range(5):
-            self.adb.simulate_tap(self.device_id, 270, 640)
+            await self.adb.simulate_tap(self.device_id, 270, 640)
             await asyncio.sleep(0.1)
 
         await self.find_and_tap("data/images/firstpack_next.png", 1)
@@ -239,7 +242,7 @@ class GameManager:
 
     async def do_tutorial(self):
         if not await search_until_found_pixel(self.adb, self.device_id, (75, 251, 234), tolerance=3):
-            print("Gray screen not found.")
+            logging.error("Gray screen not found.")
             return False
         await self.find_and_tap("data/images/mission.png", 1)
         await self.find_and_tap("data/images/mission_get1.png", 1)
@@ -247,24 +250,24 @@ class GameManager:
         await asyncio.sleep(0.5)
 
         if not await search_until_found(self.adb, self.device_id, "data/images/mission_reward.png"):
-            print("Mission gray reward screen not found.")
+            logging.error("Mission gray reward screen not found.")
             return False
-        self.adb.simulate_tap(self.device_id, 270, 900)
+        await self.adb.simulate_tap(self.device_id, 270, 900)
 
         await self.find_and_tap("data/images/mission_ok.png", 1)
 
         await asyncio.sleep(0.5)
-        self.adb.simulate_tap(self.device_id, 270, 500)
+        await self.adb.simulate_tap(self.device_id, 270, 500)
         await asyncio.sleep(0.5)
 
         for _ in range(5):
-            self.adb.simulate_tap(self.device_id, 270, 500)
+            await self.adb.simulate_tap(self.device_id, 270, 500)
             await asyncio.sleep(0.1)
 
         await asyncio.sleep(3)
 
         for _ in range(5):
-            self.adb.simulate_tap(self.device_id, 270, 500)
+            await self.adb.simulate_tap(self.device_id, 270, 500)
             await asyncio.sleep(0.1)
 
         await self.find_and_tap("data/images/mission_ok.png", 1)
@@ -273,12 +276,12 @@ class GameManager:
 
         # Open pack swiping
         for _ in range(5):
-            self.adb.simulate_swipe(self.device_id, 40, 550, 530, 550, duration=600)
+            await self.adb.simulate_swipe(self.device_id, 40, 550, 530, 550, duration=600)
             await asyncio.sleep(0.2)
 
         # Tap card
         for _ in range(7):
-            self.adb.simulate_tap(self.device_id, 270, 480)
+            await self.adb.simulate_tap(self.device_id, 270, 480)
             await asyncio.sleep(0.1)
 
         await self.find_and_tap("data/images/realpack_next.png", 1)
@@ -288,7 +291,7 @@ class GameManager:
 
         await asyncio.sleep(1)
         for _ in range(5):
-            self.adb.simulate_tap(self.device_id, 270, 480)
+            await self.adb.simulate_tap(self.device_id, 270, 480)
             await asyncio.sleep(0.2)
 
         return True
@@ -297,26 +300,26 @@ class GameManager:
         await self.find_and_tap("data/images/challenge_icon.png", 1)
 
         if not await search_until_found(self.adb, self.device_id, "data/images/challenge_free.png"):
-            print("Challenge start screen not found.")
+            logging.error("Challenge start screen not found.")
             return False
 
         # Tap free challenge
-        self.adb.simulate_tap(self.device_id, 270, 480)
+        await self.adb.simulate_tap(self.device_id, 270, 480)
         await asyncio.sleep(0.2)
 
         # Skip guide
         for _ in range(6):
-            self.adb.simulate_tap(self.device_id, 370, 770)
+            await self.adb.simulate_tap(self.device_id, 370, 770)
             await asyncio.sleep(0.5)
 
         # Tap card and ok
-        self.adb.simulate_tap(self.device_id, 350, 620)
+        await self.adb.simulate_tap(self.device_id, 350, 620)
         await asyncio.sleep(0.5)
 
         if not await search_until_found(self.adb, self.device_id, "data/images/challenge_free_enabled.png"):
-            print("Challenge start screen not found.")
+            logging.error("Challenge start screen not found.")
             return False
-        self.adb.simulate_tap(self.device_id, 390, 820)
+        await self.adb.simulate_tap(self.device_id, 390, 820)
         await asyncio.sleep(0.5)
 
         # Pick card
@@ -329,17 +332,17 @@ class GameManager:
         # Skip final guide
         await self.find_and_tap("data/images/realpack_next.png", 1)
         for _ in range(5):
-            self.adb.simulate_tap(self.device_id, 370, 770)
+            await self.adb.simulate_tap(self.device_id, 370, 770)
             await asyncio.sleep(0.5)
         return True
 
     async def do_additional_challenge(self):
         await self.find_and_tap("data/images/challenge_icon.png", 1)
         if not await search_until_found(self.adb, self.device_id, "data/images/challenge_title.png"):
-            print("Challenge start screen not found.")
+            logging.error("Challenge start screen not found.")
             return False
 
-        self.adb.simulate_tap(self.device_id, 270, 400)
+        await self.adb.simulate_tap(self.device_id, 270, 400)
         await asyncio.sleep(0.2)
 
         await self.find_and_tap("data/images/challenge_ok.png", 1)
@@ -354,7 +357,7 @@ class GameManager:
 
     async def do_final_mission(self):
         if not await search_until_found(self.adb, self.device_id, "data/images/home_enabled.png"):
-            print("Home screen not found.")
+            logging.error("Home screen not found.")
             return False
         await self.find_and_tap("data/images/mission_enabled.png", 1)
         await self.find_and_tap("data/images/mission_get1.png", 1)
@@ -368,7 +371,7 @@ class GameManager:
         async with self.lock:
             self.copy_id_event.clear()
             if not await search_until_found(self.adb, self.device_id, "data/images/home_enabled.png"):
-                print("Home screen not found.")
+                logging.error("Home screen not found.")
                 return False
             await self.find_and_tap("data/images/social.png", 1)
             await self.find_and_tap("data/images/social_friend.png", 1)
@@ -383,21 +386,21 @@ class GameManager:
         self.log.emit(f"⏳ [인스턴스 {self.device_name}] 이미지 캐싱 중...")
         await self.template_cache.load_all_templates()
         self.log.emit(f"⏳ [인스턴스 {self.device_name}] 게임 시작 중...")
-        self.game.close_game(self.device_id)
+        await asyncio.to_thread(self.game.close_game, self.device_id)
         await asyncio.sleep(2)
-        self.game.start_game(self.device_id)
+        await asyncio.to_thread(self.game.start_game, self.device_id)
 
         # Check title screen
         await self.find_and_tap("data/images/title.png", 5)
 
         # Enable speed mode
         await self.find_and_tap("data/images/mod.png", 1)
-        self.adb.simulate_swipe(self.device_id, 35, 260, 200, 260, duration=300)
+        await self.adb.simulate_swipe(self.device_id, 35, 260, 200, 260, duration=300)
         await self.find_and_tap("data/images/mod_minimize.png", 1)
 
         """
         if not await search_until_found(self.adb, self.device_id, "data/images/packpoint.png"):
-            print("login start screen not found.")
+            logging.error("login start screen not found.")
             return False
         """
         await self.find_and_tap("data/images/social.png", 5)
@@ -420,11 +423,11 @@ class GameManager:
 
             await self.find_and_tap("data/images/friend_accept.png", 1)
             for _ in range(10):
-                self.adb.simulate_tap(self.device_id, 470, 320)
+                await self.adb.simulate_tap(self.device_id, 470, 320)
                 await asyncio.sleep(0.2)
-            self.adb.simulate_tap(self.device_id, 270, 900)
+            await self.adb.simulate_tap(self.device_id, 270, 900)
             await asyncio.sleep(0.5)
-            self.adb.simulate_tap(self.device_id, 270, 900)
+            await self.adb.simulate_tap(self.device_id, 270, 900)
             await asyncio.sleep(0.5)
         return True
 
@@ -432,20 +435,20 @@ class GameManager:
         self.log.emit(f"⏳ [인스턴스 {self.device_name}] 이미지 캐싱 중...")
         await self.template_cache.load_all_templates()
         self.log.emit(f"⏳ [인스턴스 {self.device_name}] 게임 시작 중...")
-        self.game.close_game(self.device_id)
+        await asyncio.to_thread(self.game.close_game, self.device_id)
         await asyncio.sleep(2)
-        self.game.start_game(self.device_id)
+        await asyncio.to_thread(self.game.start_game, self.device_id)
 
         # Check title screen
         await self.find_and_tap("data/images/title.png", 5)
 
         # Enable speed mode
         await self.find_and_tap("data/images/mod.png", 1)
-        self.adb.simulate_swipe(self.device_id, 35, 260, 200, 260, duration=300)
+        await self.adb.simulate_swipe(self.device_id, 35, 260, 200, 260, duration=300)
         await self.find_and_tap("data/images/mod_minimize.png", 1)
 
         if not await search_until_found(self.adb, self.device_id, "data/images/packpoint.png"):
-            print("login start screen not found.")
+            logging.error("login start screen not found.")
             return False
 
         # What pack to open
@@ -456,7 +459,7 @@ class GameManager:
 
         await self.find_and_tap(f"data/images/{pack}.png", 1)
         await asyncio.sleep(0.2)
-        self.adb.simulate_tap(self.device_id, 270, 480)
+        await self.adb.simulate_tap(self.device_id, 270, 480)
 
         # Open first pack and second pack
         for _ in range(2):
@@ -465,12 +468,12 @@ class GameManager:
 
             # Open pack swiping
             for _ in range(5):
-                self.adb.simulate_swipe(self.device_id, 40, 550, 530, 550, duration=600)
+                await self.adb.simulate_swipe(self.device_id, 40, 550, 530, 550, duration=600)
                 await asyncio.sleep(0.2)
 
             # Tap card
             for _ in range(7):
-                self.adb.simulate_tap(self.device_id, 270, 480)
+                await self.adb.simulate_tap(self.device_id, 270, 480)
                 await asyncio.sleep(0.1)
 
             await self.find_and_tap("data/images/realpack_next.png", 1)
@@ -479,17 +482,17 @@ class GameManager:
 
         # Skip hourglass guide
         await self.find_and_tap("data/images/realpack_ok.png", 1)
-        self.adb.simulate_tap(self.device_id, 270, 480)
+        await self.adb.simulate_tap(self.device_id, 270, 480)
         await asyncio.sleep(0.2)
-        self.adb.simulate_tap(self.device_id, 390, 750)
+        await self.adb.simulate_tap(self.device_id, 390, 750)
         await asyncio.sleep(0.2)
-        self.adb.simulate_tap(self.device_id, 390, 750)
+        await self.adb.simulate_tap(self.device_id, 390, 750)
         await asyncio.sleep(0.2)
-        self.adb.simulate_tap(self.device_id, 365, 770)
+        await self.adb.simulate_tap(self.device_id, 365, 770)
         await asyncio.sleep(0.2)
-        self.adb.simulate_tap(self.device_id, 365, 770)
+        await self.adb.simulate_tap(self.device_id, 365, 770)
         await asyncio.sleep(0.2)
-        self.adb.simulate_tap(self.device_id, 365, 770)
+        await self.adb.simulate_tap(self.device_id, 365, 770)
         await asyncio.sleep(2)
 
         # third pack after guide
@@ -498,12 +501,12 @@ class GameManager:
 
         # Open pack swiping
         for _ in range(5):
-            self.adb.simulate_swipe(self.device_id, 40, 550, 530, 550, duration=600)
+            await self.adb.simulate_swipe(self.device_id, 40, 550, 530, 550, duration=600)
             await asyncio.sleep(0.2)
 
         # Tap card
         for _ in range(7):
-            self.adb.simulate_tap(self.device_id, 270, 480)
+            await self.adb.simulate_tap(self.device_id, 270, 480)
             await asyncio.sleep(0.1)
 
         await self.find_and_tap("data/images/realpack_next.png", 1)
@@ -514,18 +517,18 @@ class GameManager:
 
         # 4th and 5th pack
         for _ in range(2):
-            self.adb.simulate_tap(self.device_id, 400, 750)
+            await self.adb.simulate_tap(self.device_id, 400, 750)
             await self.find_and_tap("data/images/realpack_ok.png", 5)
             await self.find_and_tap("data/images/realpack_pass.png", 1)
 
             # Open pack swiping
             for _ in range(5):
-                self.adb.simulate_swipe(self.device_id, 40, 550, 530, 550, duration=600)
+                await self.adb.simulate_swipe(self.device_id, 40, 550, 530, 550, duration=600)
                 await asyncio.sleep(0.2)
 
             # Tap card
             for _ in range(7):
-                self.adb.simulate_tap(self.device_id, 270, 480)
+                await self.adb.simulate_tap(self.device_id, 270, 480)
                 await asyncio.sleep(0.1)
 
             await self.find_and_tap("data/images/realpack_next.png", 1)
@@ -540,16 +543,16 @@ class GameManager:
         self.log.emit(f"⏳ [인스턴스 {self.device_name}] 이미지 캐싱 중...")
         await self.template_cache.load_all_templates()
         self.log.emit(f"⏳ [인스턴스 {self.device_name}] 게임 시작 중...")
-        self.game.close_game(self.device_id)
+        await asyncio.to_thread(self.game.close_game, self.device_id)
         await asyncio.sleep(2)
-        self.game.start_game(self.device_id)
+        await asyncio.to_thread(self.game.start_game, self.device_id)
 
         # Check title screen
         await self.find_and_tap("data/images/title.png", 5)
 
         # Enable speed mode
         await self.find_and_tap("data/images/mod.png", 1)
-        self.adb.simulate_swipe(self.device_id, 35, 260, 200, 260, duration=300)
+        await self.adb.simulate_swipe(self.device_id, 35, 260, 200, 260, duration=300)
         await self.find_and_tap("data/images/mod_minimize.png", 1)
 
         self.log.emit(f"⏳ [인스턴스 {self.device_name}] 3초 후 계정이 삭제됨.")
@@ -571,8 +574,8 @@ class GameManager:
         await self.find_and_tap("data/images/delete_ok.png", 1)
         await asyncio.sleep(2)
 
-        self.game.close_game(self.device_id)
-        self.game.delete_account(self.device_id)
+        await asyncio.to_thread(self.game.close_game, self.device_id)
+        await asyncio.to_thread(self.game.delete_account, self.device_id)
 
         return True
 
@@ -590,12 +593,12 @@ class GameManager:
         result = await search_until_found(self.adb, self.device_id, template_path, max_attempts=max_attempts)
 
         if result is None:
-            print(f"Template {template_path} not found.")
+            logging.error(f"Template {template_path} not found.")
             return False
 
         x, y = result
 
         if x and y:
             for _ in range(taps):
-                self.adb.simulate_tap(self.device_id, x, y)
+                await self.adb.simulate_tap(self.device_id, x, y)
                 await asyncio.sleep(delay)
@@ -1,14 +1,17 @@
 import sys
 import json
+import logging
 import os
 import datetime
 import pywinctl
 import asyncio
+import qasync
+from concurrent.futures import ThreadPoolExecutor
 from PyQt6.QtWidgets import (
     QApplication, QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QTextEdit, QLabel,
     QComboBox, QTableWidget, QTableWidgetItem, QHeaderView, QMessageBox, QFileDialog,
     QDialog, QDialogButtonBox, QCheckBox, QGroupBox)
-from PyQt6.QtCore import QThread, pyqtSignal, Qt
+from PyQt6.QtCore import QObject, QThread, QTimer, pyqtSignal, Qt
 from PyQt6.QtGui import QIcon
 from modules.game_manager import GameManager
 from modules.player_manager import get_all_players
@@ -79,7 +82,16 @@ class InitializationThread(QThread):
                     self.log_signal.emit(error_msg)
                     raise ADBPortNotFound(error_msg)  # Stop execution
 
-                if adb_client.connect(port):
+            # ADB connect is I/O-bound (TCP handshake), so overlap all ports:
+            # startup drops from O(N * RTT) to O(RTT)
+            with ThreadPoolExecutor(max_workers=16) as executor:
+                results = list(executor.map(
+                    lambda p: (p, adb_client.connect(p["adb_host_port"])), selected_players
+                ))
+
+            for player, connected in results:
+                port = player["adb_host_port"]
+                if connected:
                     self.log_signal.emit(f"✅ 인스턴스 {player['playerName']} 연결 성공. (ADB 포트: {port})")
                     device_list[player['playerName']] = f"127.0.0.1:{port}"
                 else:
@@ -100,96 +112,95 @@ class InitializationThread(QThread):
         return window_name in pywinctl.getAllTitles()
 
 
-class WorkerThread(QThread):
-    """Worker thread for running automated gameplay."""
+class AutomationWorker(QObject):
+    """Launches automated gameplay for all devices as tasks on the qasync loop."""
     log_signal = pyqtSignal(str)  # Signal for logging messages
-    finished_signal = pyqtSignal(object)  # Signal when worker finishes execution
+    finished_signal = pyqtSignal(object)  # Signal when all device tasks finish
 
-    def __init__(self, game, adb, device_name, device_id, task_kind, max_retry):
+    def __init__(self, game, adb, devices: dict, task_kind, max_retry):
         super().__init__()
         self.game = game
         self.adb = adb
-        self.device_name = device_name
-        self.device_id = device_id
+        self.devices = devices
         self.task_kind = task_kind
         self.max_retry = max_retry
         self.running = True  # Flag to control execution
-        self.current_task = None  # Store the currently running asyncio task
-        self.result = None  # Store the result of the task
-        self.game_manager = GameManager(game, adb, device_name, device_id,
-                                        self.log_signal)  # Instance of GameManager for each device
-
-    def run(self):
-        """Run the worker thread with an event loop."""
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        try:
-            loop.run_until_complete(self.task())
-        except asyncio.CancelledError:
-            self.log_signal.emit(f"🛑 [인스턴스 {self.device_name}] 강제 중지됨.")
-        finally:
-            loop.close()
+        self.tasks = {}  # device_name -> asyncio.Task
+        self.results = []  # Results collected from finished device tasks
+        self.game_managers = {
+            device_name: GameManager(game, adb, device_name, device_id, self.log_signal)
+            for device_name, device_id in devices.items()
+        }  # Instance of GameManager for each device
+
+    def start(self):
+        """Launch one task per device on the running (qasync) event loop."""
+        self.tasks = {
+            device_name: asyncio.create_task(self.device_task(device_name))
+            for device_name in self.devices
+        }
+        asyncio.create_task(self._wait_all())
+
+    async def _wait_all(self):
+        """Wait for every device task, then signal completion."""
+        await asyncio.gather(*self.tasks.values(), return_exceptions=True)
+        self.finished_signal.emit(self)  # Signal to remove the worker
 
-    async def task(self):
-        """Execute automated gameplay with retry and stop support."""
-        self.log_signal.emit(f"🔄 [인스턴스 {self.device_name}] 자동 {self.task_kind} 시작 중... (최대 재시도 횟수: {self.max_retry})")
+    async def device_task(self, device_name):
+        """Execute automated gameplay for one device with retry and stop support."""
+        self.log_signal.emit(f"🔄 [인스턴스 {device_name}] 자동 {self.task_kind} 시작 중... (최대 재시도 횟수: {self.max_retry})")
 
+        game_manager = self.game_managers[device_name]
         retry = 0
         while self.running and retry < self.max_retry:
             try:
-                # Create and store the current async task
                 if self.task_kind == "gather":
-                    self.current_task = asyncio.create_task(self.game_manager.pack_gather())
+                    result = await game_manager.pack_gather()
                 elif self.task_kind == "open":
-                    self.current_task = asyncio.create_task(self.game_manager.pack_open())
+                    result = await game_manager.pack_open()
                 elif self.task_kind == "add":
-                    self.current_task = asyncio.create_task(self.game_manager.friend_add())
+                    result = await game_manager.friend_add()
                 elif self.task_kind == "delete":
-                    self.current_task = asyncio.create_task(self.game_manager.data_delete())
+                    result = await game_manager.data_delete()
                 else:
-                    self.log_signal.emit(f"❌ [인스턴스 {self.device_name}] 알 수 없는 작업 종류: {self.task_kind}")
+                    self.log_signal.emit(f"❌ [인스턴스 {device_name}] 알 수 없는 작업 종류: {self.task_kind}")
                     break
-                success = await self.current_task  # Await execution
 
-                result = await self.current_task
                 if result is not None:
-                    self.result = result
+                    self.results.append(result)
                     if self.task_kind == "gather":
-                        self.log_signal.emit(f"✅ [인스턴스 {self.device_name}] 작업 완료. 닉네임: {result[0]}, 친구ID: {result[1]}")
+                        self.log_signal.emit(f"✅ [인스턴스 {device_name}] 작업 완료. 닉네임: {result[0]}, 친구ID: {result[1]}")
                     else:
-                        self.log_signal.emit(f"✅ [인스턴스 {self.device_name}] 작업 완료.")
+                        self.log_signal.emit(f"✅ [인스턴스 {device_name}] 작업 완료.")
                     break  # 작업 성공 시 종료
                 else:
                     retry += 1
-                    self.log_signal.emit(f"⚠️ [인스턴스 {self.device_name}] 작업 실패. 재시도 중... ({retry}/{self.max_retry})")
+                    self.log_signal.emit(f"⚠️ [인스턴스 {device_name}] 작업 실패. 재시도 중... ({retry}/{self.max_retry})")
                     await asyncio.sleep(1)
 
             except asyncio.CancelledError:
-                self.log_signal.emit(f"🛑 [인스턴스 {self.device_name}] 강제 중지됨.")
+                self.log_signal.emit(f"🛑 [인스턴스 {device_name}] 강제 중지됨.")
                 break  # Exit loop immediately when canceled
 
             except Exception as e:
-                self.log_signal.emit(f"❌ [인스턴스 {self.device_name}] 오류 발생: {str(e)}")
+                self.log_signal.emit(f"❌ [인스턴스 {device_name}] 오류 발생: {str(e)}")
                 retry += 1
                 await asyncio.sleep(1)
 
         if retry >= self.max_retry:
-            self.log_signal.emit(f"❌ [인스턴스 {self.device_name}] 작업 실패. 최대 재시도 횟수 초과.")
+            self.log_signal.emit(f"❌ [인스턴스 {device_name}] 작업 실패. 최대 재시도 횟수 초과.")
 
-        self.finished_signal.emit(self)  # Signal to remove the worker
+    def stop_devices(self, device_names):
+        """Cancel the tasks for the given devices only."""
+        for device_name in device_names:
+            task = self.tasks.get(device_name)
+            if task is not None and not task.done():
+                task.cancel()
+                self.log_signal.emit(f"🛑 [인스턴스 {device_name}] 강제 종료 요청됨.")
 
     def stop(self):
         """Forcefully stop the worker and cancel ongoing tasks."""
         self.running = False  # Set flag to stop execution
-
-        # Cancel the currently running async task
-        if self.current_task and not self.current_task.done():
-            self.current_task.cancel()
-
-        self.log_signal.emit(f"🛑 [인스턴스 {self.device_name}] 강제 종료 요청됨.")
-
-        self.quit()  # Stop the QThread
-        self.wait()  # Ensure the thread is properly cleaned up
+        self.stop_devices(list(self.tasks))
 
 class DeviceSelectionDialog(QDialog):
     def __init__(self, devices: dict, parent=None):
@@ -218,7 +229,7 @@ class DeviceSelectionDialog(QDialog):
     def get_selected_devices(self) -> dict:
         selected_devices = {}
         for device_name, checkbox in self.checkboxes.items():
-            print(device_name, checkbox.isChecked())
+            logging.info(f"{device_name} selected: {checkbox.isChecked()}")
             if checkbox.isChecked():
                 selected_devices[device_name] = self.devices[device_name]
         return selected_devices
@@ -332,8 +343,20 @@ class MainGUI(QWidget):
         # Log output
         self.log_text = QTextEdit(self)
         self.log_text.setReadOnly(True)
+        # Bound the document so appends stay O(1) over long runs; Qt drops the
+        # oldest blocks once the cap is reached
+        self.log_text.document().setMaximumBlockCount(2000)
+        self.log_text.setUndoRedoEnabled(False)
         main_layout.addWidget(self.log_text)
 
+        # Buffer log lines and flush on a timer: one QTextEdit append (and one
+        # document reflow) per tick instead of one per log message
+        self._log_buf = []
+        self._log_timer = QTimer(self)
+        self._log_timer.setInterval(50)
+        self._log_timer.timeout.connect(self._flush_log)
+        self._log_timer.start()
+
         self.is_running = False
 
         # "매크로" GroupBox
@@ -452,17 +475,16 @@ class MainGUI(QWidget):
             self.open_btn.setEnabled(False)
             self.del_btn.setEnabled(False)
 
-        for device_name, device_id in self.device_list.items():
-            worker = WorkerThread(self.game, self.adb, device_name, device_id, task_kind, self.settings.get("max_retry", 3))
-            worker.log_signal.connect(self.update_log)
-            if task_kind == "gather":
-                worker.finished_signal.connect(self.gather_task_finished)
-            elif task_kind == "open":
-                worker.finished_signal.connect(self.open_task_finished)
-            elif task_kind == "add":
-                worker.finished_signal.connect(self.add_task_finished)
-            self.workers.append(worker)
-            worker.start()
+        worker = AutomationWorker(self.game, self.adb, self.device_list, task_kind, self.settings.get("max_retry", 3))
+        worker.log_signal.connect(self.update_log)
+        if task_kind == "gather":
+            worker.finished_signal.connect(self.gather_task_finished)
+        elif task_kind == "open":
+            worker.finished_signal.connect(self.open_task_finished)
+        elif task_kind == "add":
+            worker.finished_signal.connect(self.add_task_finished)
+        self.workers.append(worker)
+        worker.start()
 
     def stop_task(self):
         """Stop all running workers."""
@@ -498,8 +520,7 @@ class MainGUI(QWidget):
         if self.is_running:
             devices = self.select_devices()
             for worker in self.workers:
-                if worker.device_name in devices:
-                    worker.stop()
+                worker.stop_devices(devices)
         else:
             self.is_running = True
             self.start_task("open")
@@ -526,12 +547,11 @@ class MainGUI(QWidget):
     def start_deletion_task(self, device_list: dict):
         """Start automation for selected devices."""
 
-        for device_name, device_id in device_list.items():
-            worker = WorkerThread(self.game, self.adb, device_name, device_id, "delete", self.settings.get("max_retry", 3))
-            worker.log_signal.connect(self.update_log)
-            worker.finished_signal.connect(self.del_task_finished)
-            self.workers.append(worker)
-            worker.start()
+        worker = AutomationWorker(self.game, self.adb, device_list, "delete", self.settings.get("max_retry", 3))
+        worker.log_signal.connect(self.update_log)
+        worker.finished_signal.connect(self.del_task_finished)
+        self.workers.append(worker)
+        worker.start()
 
     def toggle_del_task(self):
         """Toggle start and stop for automation."""
@@ -552,15 +572,22 @@ class MainGUI(QWidget):
                 return
 
             devices = self.select_devices()
-            print(devices)
+            logging.info(f"Deletion targets: {devices}")
             self.start_deletion_task(devices)
             self.del_btn.setText("일괄 계정 삭제 정지")
 
         self.is_running = not self.is_running
 
     def update_log(self, message):
-        """Update the log text area."""
-        self.log_text.append(message)
+        """Queue a message for the log text area."""
+        self._log_buf.append(message)
+
+    def _flush_log(self):
+        """Append buffered log lines in a single QTextEdit update."""
+        if not self._log_buf:
+            return
+        self.log_text.append("\n".join(self._log_buf))
+        self._log_buf.clear()
 
     def update_device_list(self):
         """Update the dropdown list with device_list keys."""
@@ -572,8 +599,7 @@ class MainGUI(QWidget):
         if worker in self.workers:
             self.workers.remove(worker)
 
-        if worker.result is not None:
-            self.task_results.append(worker.result)
+        self.task_results.extend(worker.results)
 
         if not self.workers:
             self.is_running = False
@@ -707,8 +733,11 @@ class MainGUI(QWidget):
         self.update_log(f"✅ 인스턴스 {instance_name} 세이브 삭제 완료.")
 
 def launch_gui():
-    """Launch the GUI application."""
+    """Launch the GUI application with a qasync-driven event loop."""
     app = QApplication(sys.argv)
+    loop = qasync.QEventLoop(app)
+    asyncio.set_event_loop(loop)
     gui = MainGUI()
     gui.show()
-    sys.exit(app.exec())
+    with loop:
+        loop.run_forever()
@@ -11,15 +11,73 @@ logging.basicConfig(level=logging.INFO)
 
 import asyncio
 import cv2
+import hashlib
 import logging
 import os
+import threading
 import numpy as np
 from typing import Dict, Optional
 
+try:
+    import numba
+except ImportError:  # numba is optional; the cv2 path below is the fallback
+    numba = None
+
+try:
+    import xxhash
+except ImportError:  # xxhash is optional; blake2b is the stdlib fallback
+    xxhash = None
+
+def _frame_hash(buffer: bytes) -> int:
+    """스크린샷 바이트의 변경 감지용 해시 (보안 목적이 아니므로 빠른 해시 사용)"""
+    if xxhash is not None:
+        return xxhash.xxh3_64(buffer).intdigest()
+    return int.from_bytes(hashlib.blake2b(buffer, digest_size=8).digest(), "little")
+
+if numba is not None:
+    @numba.njit(cache=True, fastmath=True)
+    def _find_color(arr, tr, tg, tb, tol):
+        """첫 번째로 허용 오차 내에 드는 픽셀을 찾아 (x, y) 반환, 없으면 (-1, -1)"""
+        height, width = arr.shape[:2]
+        for y in range(height):
+            for x in range(width):
+                if (abs(int(arr[y, x, 0]) - tr) <= tol
+                        and abs(int(arr[y, x, 1]) - tg) <= tol
+                        and abs(int(arr[y, x, 2]) - tb) <= tol):
+                    return x, y
+        return -1, -1
+
+    @numba.njit(cache=True, fastmath=True, parallel=True)
+    def _find_color_parallel(arr, tr, tg, tb, tol):
+        """행 단위 prange 병렬 탐색 — 행별 첫 히트를 모은 뒤 가장 위의 것을 반환"""
+        height, width = arr.shape[:2]
+        # prange 안에서는 조기 return이 불가능하므로 행마다 첫 히트 x를 기록하고
+        # 바깥의 직렬 루프가 가장 위 행을 고른다 (행 단위 쓰기라 경쟁 없음)
+        first_hit = np.full(height, -1, np.int64)
+        for y in numba.prange(height):
+            for x in range(width):
+                if (abs(int(arr[y, x, 0]) - tr) <= tol
+                        and abs(int(arr[y, x, 1]) - tg) <= tol
+                        and abs(int(arr[y, x, 2]) - tb) <= tol):
+                    first_hit[y] = x
+                    break
+        for y in range(height):
+            if first_hit[y] >= 0:
+                return first_hit[y], y
+        return -1, -1
+
+    # Trigger compilation at import time so the first real search does not
+    # pay the JIT cost (cache=True keeps the artifact across runs).
+    _find_color(np.zeros((1, 1, 3), np.uint8), 0, 0, 0, 0)
+    _find_color_parallel(np.zeros((1, 1, 3), np.uint8), 0, 0, 0, 0)
+
 class TemplateCache:
     """싱글톤 패턴으로 템플릿 이미지를 캐싱하는 클래스"""
     _instance = None
     _cache: Dict[str, np.ndarray] = {}
+    _cache_small: Dict[str, np.ndarray] = {}  # 2배 축소 템플릿 (피라미드 1단계 탐색용)
+    _roi: Dict[str, Tuple[int, int, int, int]] = {}  # 템플릿별 탐색 영역 (x0, y0, x1, y1)
+    _canonical: Dict[str, str] = {}  # 호출 경로 → 절대 경로 메모 (abspath 반복 호출 방지)
     _image_dir = os.path.abspath("./data/images")  # 절대 경로 변환
 
     def __new__(cls):
@@ -27,9 +85,17 @@ class TemplateCache:
             cls._instance = super(TemplateCache, cls).__new__(cls)
         return cls._instance
 
+    def _canon(self, template_path: str) -> str:
+        """경로 정규화 결과를 메모 — abspath는 getcwd 시스템콜을 동반하므로 경로당 1회만"""
+        canonical = self._canonical.get(template_path)
+        if canonical is None:
+            canonical = os.path.abspath(template_path)
+            self._canonical[template_path] = canonical
+        return canonical
+
     async def load_template(self, template_path: str) -> Optional[np.ndarray]:
         """단일 템플릿을 로드 및 캐싱 (경로 정규화 적용)"""
-        template_path = os.path.abspath(template_path)  # 절대 경로로 변환
+        template_path = self._canon(template_path)
 
         if template_path in self._cache:
             return self._cache[template_path]
@@ -42,6 +108,11 @@ class TemplateCache:
             return None
 
         self._cache[template_path] = template
+        # 축소본을 미리 계산해 두면 매 호출마다 resize할 필요가 없음
+        # pyrDown은 분리형 가우시안 필터라 INTER_AREA보다 빠르고,
+        # 블러 덕분에 절반 해상도 매칭이 앨리어싱에 덜 민감함
+        if min(template.shape[:2]) >= 8:
+            self._cache_small[template_path] = cv2.pyrDown(template)
         return template
 
     async def load_all_templates(self):
@@ -51,18 +122,31 @@ class TemplateCache:
             return
 
         tasks = []
-        for filename in os.listdir(self._image_dir):
-            if filename.lower().endswith(".png"):
-                template_path = os.path.abspath(os.path.join(self._image_dir, filename))  # 절대 경로 변환
-                tasks.append(self.load_template(template_path))
+        # scandir는 디렉터리 읽기에서 이름과 경로를 함께 제공하므로
+        # 엔트리마다 join/abspath/stat을 따로 할 필요가 없음
+        with os.scandir(self._image_dir) as it:
+            for entry in it:
+                if entry.name.lower().endswith(".png"):
+                    tasks.append(self.load_template(entry.path))
 
         await asyncio.gather(*tasks)
         logging.info(f"Loaded {len(self._cache)} templates into cache.")
 
     def get_template(self, template_path: str) -> Optional[np.ndarray]:
         """캐싱된 템플릿 반환 (경로 정규화 적용)"""
-        template_path = os.path.abspath(template_path)  # 절대 경로 변환
-        return self._cache.get(template_path, None)
+        return self._cache.get(self._canon(template_path), None)
+
+    def get_template_small(self, template_path: str) -> Optional[np.ndarray]:
+        """캐싱된 2배 축소 템플릿 반환 (경로 정규화 적용)"""
+        return self._cache_small.get(self._canon(template_path), None)
+
+    def set_roi(self, template_path: str, roi: Tuple[int, int, int, int]):
+        """템플릿이 나타나는 화면 영역 (x0, y0, x1, y1) 등록 — 매칭 범위 제한용"""
+        self._roi[self._canon(template_path)] = roi
+
+    def get_roi(self, template_path: str) -> Optional[Tuple[int, int, int, int]]:
+        """등록된 탐색 영역 반환 (없으면 None = 전체 화면)"""
+        return self._roi.get(self._canon(template_path), None)
 
 
 def image_to_array(image: Image) -> np.ndarray:
@@ -72,9 +156,279 @@ def image_to_array(image: Image) -> np.ndarray:
     :param image: PIL Image object
     :return: NumPy array of the image
     """
-    return np.array(image.convert("L"))  # Convert to grayscale
+    # asarray maps PIL's buffer without copying (the image is load()ed by the
+    # screenshot path); cvtColor does the luminance mix in one SIMD pass
+    # instead of PIL's convert("L") plus a full-frame copy.
+    arr = np.asarray(image)
+    if arr.ndim == 2:
+        return arr
+    if arr.shape[2] == 4:
+        return cv2.cvtColor(arr, cv2.COLOR_RGBA2GRAY)
+    return cv2.cvtColor(arr, cv2.COLOR_RGB2GRAY)
+
+# Below this template size (pixels) direct spatial correlation beats the FFT path
+_FFT_MIN_TEMPLATE_SIZE = 2500
+
+# Cached template spectra keyed by (template id, padded dft shape); templates
+# live in TemplateCache forever, so their ids are stable keys.
+_template_dfts: Dict[Tuple[int, int, int], np.ndarray] = {}
+_dft_lock = threading.Lock()
+
+# Per-template mean and centered L2 norm, computed once per template.
+# TM_CCOEFF_NORMED recomputes both on every matchTemplate call otherwise.
+_template_stats: Dict[int, Tuple[float, float]] = {}
+
+def _get_template_stats(template: np.ndarray) -> Tuple[float, float]:
+    """Cached (mean, centered L2 norm) of a template for CCOEFF normalization."""
+    stats = _template_stats.get(id(template))
+    if stats is None:
+        as_float = template.astype(np.float32)
+        mean = float(as_float.mean())
+        norm = float(np.sqrt(np.sum((as_float - mean) ** 2)))
+        stats = _template_stats[id(template)] = (mean, max(norm, 1e-6))
+    return stats
+
+class _FrameContext:
+    """
+    Per-frame cache of derived products shared across templates.
+
+    When one screenshot is matched against K templates, the half-resolution
+    resize, the padded frame DFTs and the integral images are identical for
+    every template — this caches each one so it is computed once per frame
+    instead of once per template. Entries are keyed by array identity (the
+    array itself is held in the value, so ids stay valid for the context's
+    lifetime); a context must not outlive its frame.
+    """
+
+    def __init__(self):
+        self._small: Dict[object, np.ndarray] = {}
+        self._dfts: Dict[Tuple[int, int, int], Tuple[np.ndarray, np.ndarray]] = {}
+        self._integrals: Dict[int, Tuple[np.ndarray, np.ndarray, np.ndarray]] = {}
+
+    def get_small(self, screen: np.ndarray, roi_key) -> np.ndarray:
+        small = self._small.get(roi_key)
+        if small is None:
+            small = self._small[roi_key] = cv2.pyrDown(screen)
+        return small
+
+    def get_dft(self, frame: np.ndarray, dft_h: int, dft_w: int) -> np.ndarray:
+        key = (id(frame), dft_h, dft_w)
+        entry = self._dfts.get(key)
+        if entry is None or entry[0] is not frame:
+            padded = np.zeros((dft_h, dft_w), np.float32)
+            padded[: frame.shape[0], : frame.shape[1]] = frame
+            entry = self._dfts[key] = (frame, cv2.dft(padded, flags=cv2.DFT_COMPLEX_OUTPUT))
+        return entry[1]
+
+    def get_integral2(self, frame: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        entry = self._integrals.get(id(frame))
+        if entry is None or entry[0] is not frame:
+            # CV_64F sums: the default int32 sum image overflows when window
+            # sums get squared downstream
+            sum_int, sq_int = cv2.integral2(frame, sdepth=cv2.CV_64F, sqdepth=cv2.CV_64F)
+            entry = self._integrals[id(frame)] = (frame, sum_int, sq_int)
+        return entry[1], entry[2]
+
+def _fft_ccoeff_normed(screen: np.ndarray, template: np.ndarray,
+                       ctx: Optional[_FrameContext] = None) -> np.ndarray:
+    """
+    TM_CCOEFF_NORMED-equivalent correlation computed via DFT.
+
+    The raw cross-correlation comes from the cached template spectrum; the
+    mean term folds out algebraically (CCOEFF = CCORR - template_mean *
+    window_sum) and the denominator uses the per-window variance from the
+    integral images, matching matchTemplate's CCOEFF_NORMED rather than the
+    brightness-biased CCORR_NORMED. Only the frame DFT and integrals are
+    paid per call, and a _FrameContext amortizes even those across templates.
+
+    :param screen: Grayscale screenshot (uint8).
+    :param template: Grayscale template (uint8), smaller than the screen.
+    :param ctx: Optional per-frame cache shared across templates.
+    :return: Correlation result map of shape (H - th + 1, W - tw + 1).
+    """
+    screen_h, screen_w = screen.shape[:2]
+    template_h, template_w = template.shape[:2]
+    dft_h = cv2.getOptimalDFTSize(screen_h)
+    dft_w = cv2.getOptimalDFTSize(screen_w)
+
+    key = (id(template), dft_h, dft_w)
+    with _dft_lock:
+        template_dft = _template_dfts.get(key)
+        if template_dft is None:
+            padded = np.zeros((dft_h, dft_w), np.float32)
+            padded[:template_h, :template_w] = template
+            template_dft = _template_dfts[key] = cv2.dft(padded, flags=cv2.DFT_COMPLEX_OUTPUT)
+    template_mean, template_norm = _get_template_stats(template)
+
+    if ctx is not None:
+        frame_dft = ctx.get_dft(screen, dft_h, dft_w)
+    else:
+        frame = np.zeros((dft_h, dft_w), np.float32)
+        frame[:screen_h, :screen_w] = screen
+        frame_dft = cv2.dft(frame, flags=cv2.DFT_COMPLEX_OUTPUT)
+    spectrum = cv2.mulSpectrums(frame_dft, template_dft, 0, conjB=True)
+    corr = cv2.idft(spectrum, flags=cv2.DFT_REAL_OUTPUT | cv2.DFT_SCALE)
+    corr = corr[: screen_h - template_h + 1, : screen_w - template_w + 1]
+
+    # Per-window sum and variance from the integral images
+    if ctx is not None:
+        sum_int, sq_int = ctx.get_integral2(screen)
+    else:
+        sum_int, sq_int = cv2.integral2(screen, sdepth=cv2.CV_64F, sqdepth=cv2.CV_64F)
+    win_sum = (sum_int[template_h:, template_w:] - sum_int[:-template_h, template_w:]
+               - sum_int[template_h:, :-template_w] + sum_int[:-template_h, :-template_w])
+    win_sq = (sq_int[template_h:, template_w:] - sq_int[:-template_h, template_w:]
+              - sq_int[template_h:, :-template_w] + sq_int[:-template_h, :-template_w])
+    area = template_h * template_w
+    win_var = np.maximum(win_sq - win_sum * win_sum / area, 0)
+
+    return (corr - template_mean * win_sum) / np.maximum(np.sqrt(win_var) * template_norm, 1e-6)
+
+# OpenCV T-API: when an OpenCL device is present, UMat inputs route
+# matchTemplate through GPU shaders instead of the CPU correlation loop
+_HAVE_OPENCL = cv2.ocl.haveOpenCL()
+if _HAVE_OPENCL:
+    cv2.ocl.setUseOpenCL(True)
+
+_template_umats: Dict[int, "cv2.UMat"] = {}
+
+def _ccoeff_prenorm(screen: np.ndarray, template: np.ndarray,
+                    ctx: Optional[_FrameContext] = None) -> np.ndarray:
+    """
+    TM_CCOEFF_NORMED computed from cached per-template statistics.
+
+    Runs TM_CCORR directly on the uint8 frame and template — half the bytes
+    through the caches compared to float32 inputs — and folds the mean term
+    out algebraically: CCOEFF = CCORR - template_mean * window_sum. The
+    per-window denominator comes from one integral-image pass; the template
+    mean and centered norm are cached, so only frame-side work is paid per call.
+    """
+    template_mean, template_norm = _get_template_stats(template)
+
+    template_h, template_w = template.shape[:2]
+    area = template_h * template_w
+
+    corr = cv2.matchTemplate(screen, template, cv2.TM_CCORR,
+                             result=_get_result_buffer(screen.shape, template.shape))
+
+    if ctx is not None:
+        sum_int, sq_int = ctx.get_integral2(screen)
+    else:
+        # CV_64F sum image: squaring int32 window sums below would overflow
+        # for any window whose sum exceeds 46340 (common on bright UI)
+        sum_int, sq_int = cv2.integral2(screen, sdepth=cv2.CV_64F, sqdepth=cv2.CV_64F)
+    win_sum = (sum_int[template_h:, template_w:] - sum_int[:-template_h, template_w:]
+               - sum_int[template_h:, :-template_w] + sum_int[:-template_h, :-template_w])
+    win_sq = (sq_int[template_h:, template_w:] - sq_int[:-template_h, template_w:]
+              - sq_int[template_h:, :-template_w] + sq_int[:-template_h, :-template_w])
+    win_var = np.maximum(win_sq - win_sum * win_sum / area, 0)
+    return (corr - template_mean * win_sum) / np.maximum(np.sqrt(win_var) * template_norm, 1e-6)
+
+def _correlate(screen: np.ndarray, template: np.ndarray,
+               ctx: Optional[_FrameContext] = None) -> np.ndarray:
+    """
+    TM_CCOEFF_NORMED-grade correlation dispatched to the best available backend.
 
-async def template_match(adb_interaction: ADBInteraction, device_id: str, template_path: str, threshold: float = 0.80) -> Optional[Tuple[int, int]]:
+    Large templates use the cached-spectrum FFT path; otherwise the OpenCL
+    UMat path is used when available, falling back to CPU matchTemplate with
+    a reused result buffer.
+    """
+    if template.size > _FFT_MIN_TEMPLATE_SIZE:
+        return _fft_ccoeff_normed(screen, template, ctx)
+    if _HAVE_OPENCL:
+        template_umat = _template_umats.get(id(template))
+        if template_umat is None:
+            template_umat = _template_umats[id(template)] = cv2.UMat(template)
+        result = cv2.matchTemplate(cv2.UMat(screen), template_umat, cv2.TM_CCOEFF_NORMED)
+        return result.get()  # Only the small result map is copied back to host
+    return _ccoeff_prenorm(screen, template, ctx)
+
+# Reusable matchTemplate result buffers, keyed by (screen_shape, template_shape).
+# Thread-local so concurrent worker threads never share a buffer.
+_result_buffers = threading.local()
+
+def _get_result_buffer(screen_shape: Tuple[int, int], template_shape: Tuple[int, int]) -> np.ndarray:
+    """matchTemplate 결과 버퍼를 재사용 (호출마다 수 MB의 float32 할당 방지)"""
+    cache = getattr(_result_buffers, "cache", None)
+    if cache is None:
+        cache = _result_buffers.cache = {}
+    key = (screen_shape, template_shape)
+    buffer = cache.get(key)
+    if buffer is None:
+        height = screen_shape[0] - template_shape[0] + 1
+        width = screen_shape[1] - template_shape[1] + 1
+        buffer = cache[key] = np.empty((height, width), np.float32)
+    return buffer
+
+def _match_sync(screenshot_array: np.ndarray, template: np.ndarray,
+                template_small: Optional[np.ndarray], threshold: float,
+                roi: Optional[Tuple[int, int, int, int]] = None,
+                ctx: Optional[_FrameContext] = None) -> Optional[Tuple[int, int]]:
+    """
+    Synchronous template-matching kernel (runs in a worker thread).
+
+    :param screenshot_array: Grayscale screenshot as a NumPy array.
+    :param template: Grayscale template image.
+    :param template_small: Optional half-resolution template for the coarse pass.
+    :param threshold: Matching confidence threshold (0 to 1).
+    :param roi: Optional (x0, y0, x1, y1) screen region to restrict the search.
+    :param ctx: Optional per-frame cache shared across templates.
+    :return: (center_x, center_y) of the matched image, or None if not found.
+    """
+    roi_x = roi_y = 0
+    if roi is not None:
+        # Restricting the search area cuts correlation cost proportionally
+        roi_x, roi_y, roi_x1, roi_y1 = roi
+        screenshot_array = screenshot_array[roi_y:roi_y1, roi_x:roi_x1]
+
+    template_h, template_w = template.shape[:2]  # Get template size
+
+    if template_small is not None:
+        # Coarse pass: match at half resolution with a slightly relaxed threshold.
+        # This cuts the correlation cost ~16x on the common "not found" path.
+        if ctx is not None:
+            screen_small = ctx.get_small(screenshot_array, roi)
+        else:
+            screen_small = cv2.pyrDown(screenshot_array)
+        result = _correlate(screen_small, template_small, ctx)
+        _, max_val, _, (sx, sy) = cv2.minMaxLoc(result)
+
+        if max_val < threshold - 0.05:
+            return None
+
+        # Fine pass: refine in a small full-resolution window around the candidate
+        screen_h, screen_w = screenshot_array.shape[:2]
+        x0 = max(2 * sx - 8, 0)
+        y0 = max(2 * sy - 8, 0)
+        x1 = min(2 * sx + template_w + 8, screen_w)
+        y1 = min(2 * sy + template_h + 8, screen_h)
+        roi = screenshot_array[y0:y1, x0:x1]
+
+        if roi.shape[0] < template_h or roi.shape[1] < template_w:
+            return None
+
+        result = cv2.matchTemplate(roi, template, cv2.TM_CCOEFF_NORMED,
+                                   result=_get_result_buffer(roi.shape, template.shape))
+        _, max_val, _, (x, y) = cv2.minMaxLoc(result)
+        if max_val < threshold:
+            return None
+        x += x0
+        y += y0
+    else:
+        # Template too small to downscale safely; match at full resolution
+        result = _correlate(screenshot_array, template, ctx)
+        _, max_val, _, (x, y) = cv2.minMaxLoc(result)
+        if max_val < threshold:
+            return None
+
+    # Compute the center point of the best match (in full-screen coordinates)
+    center_x = roi_x + x + (template_w // 2)
+    center_y = roi_y + y + (template_h // 2)
+
+    return center_x, center_y
+
+async def template_match(adb_interaction: ADBInteraction, device_id: str, template_path: str, threshold: float = 0.80,
+                         roi: Optional[Tuple[int, int, int, int]] = None) -> Optional[Tuple[int, int]]:
     """
     Capture a screenshot and perform template matching.
 
@@ -82,68 +436,226 @@ async def template_match(adb_interaction: ADBInteraction, device_id: str, templa
     :param device_id: The ADB device ID.
     :param template_path: Path to the template image file.
     :param threshold: Matching confidence threshold (0 to 1).
+    :param roi: Optional (x0, y0, x1, y1) region to search; defaults to the
+                template's registered ROI (or the full frame).
     :return: (center_x, center_y) of the matched image, or None if not found.
     """
-    # Capture a fresh screenshot (returns a PIL Image)
-    screenshot = await adb_interaction.take_screenshot(device_id, return_bitmap=True)
+    # Capture the frame as PNG bytes; imdecode goes straight to a grayscale
+    # ndarray without the PIL decode + convert round trip
+    buffer = await adb_interaction.take_screenshot_bytes(device_id)
 
-    if screenshot is None:
+    if not buffer:
         logging.error("Error: Screenshot not available.")
         return None
 
     template_cache = TemplateCache()
-    template = template_cache.get_template(os.path.abspath(template_path))
+    template = template_cache.get_template(template_path)
 
     if template is None:
         logging.error("Error: Template not available.")
         return None
 
-    screenshot_array = image_to_array(screenshot)
-    template_h, template_w = template.shape[:2]  # Get template size
+    template_small = template_cache.get_template_small(template_path)
+    if roi is None:
+        roi = template_cache.get_roi(template_path)
 
-    # Perform template matching
-    result = cv2.matchTemplate(screenshot_array, template, cv2.TM_CCOEFF_NORMED)
-    loc = np.where(result >= threshold)
+    # OpenCV/NumPy release the GIL in their C kernels, so running the match
+    # in a worker thread keeps the event loop free for other device coroutines.
+    def _run() -> Optional[Tuple[int, int]]:
+        screenshot_array = cv2.imdecode(np.frombuffer(buffer, np.uint8), cv2.IMREAD_GRAYSCALE)
+        if screenshot_array is None:
+            return None
+        return _match_sync(screenshot_array, template, template_small, threshold, roi)
 
-    matches = list(zip(*loc[::-1]))  # Convert to (x, y) positions
+    return await asyncio.to_thread(_run)
 
-    if not matches:
-        return None
+async def match_many_devices(adb_interaction: ADBInteraction, device_ids: list, template_path: str,
+                             threshold: float = 0.80) -> Dict[str, Optional[Tuple[int, int]]]:
+    """
+    Run template_match concurrently across several devices.
 
-    # Select the first match and compute the center point
-    x, y = matches[0]
-    center_x = x + (template_w // 2)
-    center_y = y + (template_h // 2)
+    Captures overlap on the event loop while a semaphore sized to the CPU
+    count bounds how many decode+correlate stages run at once, so a large
+    device fleet doesn't thrash the cores.
 
-    return center_x, center_y
+    :param adb_interaction: Instance of ADBInteraction to take screenshots.
+    :param device_ids: The ADB device IDs to match against.
+    :param template_path: Path to the template image file.
+    :param threshold: Matching confidence threshold (0 to 1).
+    :return: Mapping of device ID to match coordinates (or None).
+    """
+    semaphore = asyncio.Semaphore(os.cpu_count() or 4)
+
+    async def _one(device_id: str):
+        async with semaphore:
+            return device_id, await template_match(adb_interaction, device_id, template_path, threshold)
+
+    return dict(await asyncio.gather(*(_one(device_id) for device_id in device_ids)))
 
-async def search_until_found(adb_interaction: ADBInteraction, device_id: str, template_path: str, max_attempts: int = 100, delay: float = 0.1) -> Optional[Tuple[int, int]]:
+async def search_until_found(adb_interaction: ADBInteraction, device_id: str, template_path, max_attempts: int = 100, delay: float = 0.1,
+                             roi: Optional[Tuple[int, int, int, int]] = None) -> Optional[Tuple[int, int]]:
     """
     Repeatedly take screenshots and search for an image until it's found or max attempts reached.
 
     :param adb_interaction: Instance of ADBInteraction to take screenshots.
     :param device_id: The ADB device ID.
-    :param template_path: Path to the template image file.
+    :param template_path: Path to the template image file, or a list of paths
+                          to match any of them against a single capture per tick.
     :param max_attempts: Maximum number of attempts before giving up.
-    :param delay: Delay (in seconds) between attempts.
+    :param delay: Maximum delay (in seconds) between attempts.
+    :param roi: Optional (x0, y0, x1, y1) region to search; defaults to the
+                template's registered ROI (or the full frame).
     :return: (x, y) coordinates if found, otherwise None.
     """
+    if isinstance(template_path, (list, tuple)):
+        found = await search_any(adb_interaction, device_id, list(template_path),
+                                 max_attempts=max_attempts, delay=delay)
+        return None if found is None else (found[1], found[2])
+
+    template_cache = TemplateCache()
+    template = template_cache.get_template(template_path)
+    if template is None:
+        logging.error("Error: Template not available.")
+        return None
+    template_small = template_cache.get_template_small(template_path)
+    if roi is None:
+        roi = template_cache.get_roi(template_path)
+
+    last_hash = None
     for attempt in range(max_attempts):
         logging.info(f"Attempt to find {template_path} ({attempt + 1}/{max_attempts})")
 
-        match = await template_match(adb_interaction, device_id, template_path)
+        buffer = await adb_interaction.take_screenshot_bytes(device_id)
+        match = None
+        if buffer:
+            frame_hash = _frame_hash(buffer)
+            if frame_hash != last_hash:
+                last_hash = frame_hash
+
+                def _run() -> Optional[Tuple[int, int]]:
+                    screenshot_array = cv2.imdecode(np.frombuffer(buffer, np.uint8), cv2.IMREAD_GRAYSCALE)
+                    if screenshot_array is None:
+                        return None
+                    return _match_sync(screenshot_array, template, template_small, 0.80, roi)
+
+                match = await asyncio.to_thread(_run)
+            # An unchanged frame already failed to match on the previous
+            # attempt, so skip the decode and correlation entirely.
 
         if match is not None:
             x, y = match
             logging.info(f"Image found at ({x}, {y}) on attempt {attempt + 1}.")
             return x, y
 
-        await asyncio.sleep(delay)  # Wait before next attempt
+        # Exponential backoff: poll quickly at first (elements usually appear
+        # within tens of ms), then back off toward the configured delay.
+        await asyncio.sleep(min(0.01 * (1.5 ** attempt), delay))
 
     logging.info("Image not found after max attempts.")
     return None
 
 
+def _load_entries(template_paths: list) -> list:
+    """Resolve template paths into (path, template, small, roi) tuples, skipping missing ones."""
+    template_cache = TemplateCache()
+    entries = []
+    for template_path in template_paths:
+        template = template_cache.get_template(template_path)
+        if template is None:
+            logging.error(f"Error: Template {template_path} not available.")
+            continue
+        entries.append((template_path, template, template_cache.get_template_small(template_path),
+                        template_cache.get_roi(template_path)))
+    return entries
+
+def _match_any_on_array(screenshot_array: np.ndarray, entries: list, threshold: float) -> Optional[Tuple[str, int, int]]:
+    """Match one already-decoded frame against several templates; pure CPU, no I/O."""
+    # One context per frame: the half-res resize, frame DFTs and integral
+    # images are computed once and shared by every template below.
+    ctx = _FrameContext()
+    for path, template, template_small, roi in entries:
+        match = _match_sync(screenshot_array, template, template_small, threshold, roi, ctx)
+        if match is not None:
+            return path, match[0], match[1]
+    return None
+
+async def match_any(adb_interaction: ADBInteraction, device_id: str, template_paths: list,
+                    threshold: float = 0.80) -> Optional[Tuple[str, int, int]]:
+    """
+    Take one screenshot and match it against several templates.
+
+    The frame is captured and decoded once; every template correlates against
+    the same cached array instead of triggering its own ADB round trip.
+
+    :param adb_interaction: Instance of ADBInteraction to take screenshots.
+    :param device_id: The ADB device ID.
+    :param template_paths: Paths to the template image files.
+    :param threshold: Matching confidence threshold (0 to 1).
+    :return: (template_path, center_x, center_y) of the first match, or None.
+    """
+    entries = _load_entries(template_paths)
+    if not entries:
+        return None
+
+    buffer = await adb_interaction.take_screenshot_bytes(device_id)
+    if not buffer:
+        logging.error("Error: Screenshot not available.")
+        return None
+
+    def _run() -> Optional[Tuple[str, int, int]]:
+        screenshot_array = cv2.imdecode(np.frombuffer(buffer, np.uint8), cv2.IMREAD_GRAYSCALE)
+        if screenshot_array is None:
+            return None
+        return _match_any_on_array(screenshot_array, entries, threshold)
+
+    return await asyncio.to_thread(_run)
+
+async def search_any(adb_interaction: ADBInteraction, device_id: str, template_paths: list,
+                     threshold: float = 0.80, max_attempts: int = 100, delay: float = 0.1) -> Optional[Tuple[str, int, int]]:
+    """
+    Repeatedly take one screenshot per tick and match it against several templates.
+
+    Amortizes the ADB screenshot transfer (the dominant cost) across all
+    templates instead of capturing a fresh frame per template.
+
+    :param adb_interaction: Instance of ADBInteraction to take screenshots.
+    :param device_id: The ADB device ID.
+    :param template_paths: Paths to the template image files.
+    :param threshold: Matching confidence threshold (0 to 1).
+    :param max_attempts: Maximum number of attempts before giving up.
+    :param delay: Maximum delay (in seconds) between attempts.
+    :return: (template_path, center_x, center_y) of the first match, or None.
+    """
+    entries = _load_entries(template_paths)
+    if not entries:
+        return None
+
+    for attempt in range(max_attempts):
+        logging.info(f"Attempt to find any of {len(entries)} templates ({attempt + 1}/{max_attempts})")
+
+        buffer = await adb_interaction.take_screenshot_bytes(device_id)
+        if not buffer:
+            logging.error("Error: Screenshot not available.")
+        else:
+            def _run() -> Optional[Tuple[str, int, int]]:
+                screenshot_array = cv2.imdecode(np.frombuffer(buffer, np.uint8), cv2.IMREAD_GRAYSCALE)
+                if screenshot_array is None:
+                    return None
+                return _match_any_on_array(screenshot_array, entries, threshold)
+
+            found = await asyncio.to_thread(_run)
+            if found is not None:
+                path, x, y = found
+                logging.info(f"Image {path} found at ({x}, {y}) on attempt {attempt + 1}.")
+                return found
+
+        # Exponential backoff capped at the configured delay
+        await asyncio.sleep(min(0.01 * (1.5 ** attempt), delay))
+
+    logging.info("No template found after max attempts.")
+    return None
+
+
 async def count_template_matches(adb_interaction: ADBInteraction, device_id: str, template_path: str,
                                  threshold: float = 0.95, y_limit: int = None) -> int:
     """
@@ -158,32 +670,119 @@ async def count_template_matches(adb_interaction: ADBInteraction, device_id: str
                     If None, the entire screenshot is used.
     :return: The number of times the template was found in the (cropped) screenshot.
     """
-    # Capture a fresh screenshot (returns a PIL Image)
-    screenshot = await adb_interaction.take_screenshot(device_id, return_bitmap=True)
-    if screenshot is None:
+    buffer = await adb_interaction.take_screenshot_bytes(device_id)
+    if not buffer:
         logging.error("Error: Screenshot not available.")
         return 0
 
     template_cache = TemplateCache()
-    template = template_cache.get_template(os.path.abspath(template_path))
+    template = template_cache.get_template(template_path)
     if template is None:
         logging.error("Error: Template not available.")
         return 0
 
-    screenshot_array = image_to_array(screenshot)
+    screenshot_array = cv2.imdecode(np.frombuffer(buffer, np.uint8), cv2.IMREAD_GRAYSCALE)
+    if screenshot_array is None:
+        logging.error("Error: Screenshot decode failed.")
+        return 0
 
     if y_limit is not None:
         screenshot_height = screenshot_array.shape[0]
         if y_limit < screenshot_height:
             screenshot_array = screenshot_array[:y_limit, :]
 
+    if screenshot_array.size > 1e6:
+        # Large frame: tile the correlation so it stays cache-resident
+        return len(tiled_match_template(screenshot_array, template, threshold))
+
     result = cv2.matchTemplate(screenshot_array, template, cv2.TM_CCOEFF_NORMED)
-    loc = np.where(result >= threshold)
-    matches = list(zip(*loc[::-1]))  # 좌표 배열을 (x, y) 튜플의 리스트로 변환
 
-    return len(matches)
+    # Count above-threshold positions without materializing coordinates
+    return int(np.count_nonzero(result >= threshold))
+
+def tiled_match_template(image: np.ndarray, template: np.ndarray, threshold: float,
+                         tile: Tuple[int, int] = (512, 512)) -> list:
+    """
+    Run matchTemplate over tiles so each correlation stays cache-resident.
 
-async def pixel_search(adb_interaction: ADBInteraction, device_id: str, target_color: Tuple[int, int, int], tolerance: int = 10) -> Optional[Tuple[int, int]]:
+    Full-frame correlation against a large template streams the whole image
+    through the cache for every template row; slicing the frame into tiles a
+    couple of template-sizes wide keeps each matchTemplate call within L2 and
+    caps the size of the per-call result allocation. Tiles partition the
+    window start positions exactly, so thresholded hits are neither lost nor
+    double-counted at tile seams.
+
+    :param image: Grayscale screenshot array.
+    :param template: Grayscale template array.
+    :param threshold: Matching confidence threshold (0 to 1).
+    :param tile: Minimum tile size; grown to 2x the template if needed.
+    :return: List of (x, y) top-left corners of above-threshold windows.
+    """
+    template_h, template_w = template.shape[:2]
+    tile_h = max(tile[0], 2 * template_h)
+    tile_w = max(tile[1], 2 * template_w)
+    height, width = image.shape[:2]
+
+    matches = []
+    # Each tile contributes tile-th+1 distinct window start rows; stepping by
+    # that count partitions [0, H-th] with no overlap between tiles.
+    step_y = tile_h - template_h + 1
+    step_x = tile_w - template_w + 1
+    for y0 in range(0, max(height - template_h + 1, 1), step_y):
+        for x0 in range(0, max(width - template_w + 1, 1), step_x):
+            sub = image[y0:y0 + tile_h, x0:x0 + tile_w]
+            if sub.shape[0] < template_h or sub.shape[1] < template_w:
+                continue
+            result = cv2.matchTemplate(sub, template, cv2.TM_CCOEFF_NORMED)
+            ys, xs = np.nonzero(result >= threshold)
+            matches.extend((int(x0 + x), int(y0 + y)) for y, x in zip(ys, xs))
+    return matches
+
+def _pixel_search_sync(screenshot_array: np.ndarray, target_color: Tuple[int, int, int],
+                       tolerance: int) -> Optional[Tuple[int, int]]:
+    """
+    Synchronous pixel-color search kernel (runs in a worker thread).
+
+    The screenshot and target color must use the same channel order.
+
+    :param screenshot_array: Screenshot as an HxWx3 NumPy array.
+    :param target_color: The color to search for, in the array's channel order.
+    :param tolerance: Allowed variation for color matching.
+    :return: (x, y) coordinates if found, otherwise None.
+    """
+    if numba is not None:
+        # Fused single-pass kernels with no full-frame temporaries. Small
+        # frames (ROI crops) use the serial early-exit scan; full frames are
+        # split across cores, where the thread fan-out pays for itself even
+        # though rows past the first hit are still scanned.
+        if screenshot_array.size >= 1_000_000:
+            x, y = _find_color_parallel(screenshot_array, target_color[0], target_color[1],
+                                        target_color[2], tolerance)
+        else:
+            x, y = _find_color(screenshot_array, target_color[0], target_color[1],
+                               target_color[2], tolerance)
+        if x < 0:
+            return None
+        return x, y
+
+    # Single SIMD pass over the frame: inRange against precomputed clamped
+    # bounds, with no absdiff intermediate or broadcast temporaries.
+    lo = np.array([max(0, c - tolerance) for c in target_color], np.uint8)
+    hi = np.array([min(255, c + tolerance) for c in target_color], np.uint8)
+    mask = cv2.inRange(screenshot_array, lo, hi)
+
+    # argmax short-circuits at the first set byte and returns a scalar,
+    # so no (N, 2) coordinate array is materialized for a single hit.
+    flat_idx = int(mask.argmax())
+    if not mask.flat[flat_idx]:
+        return None
+
+    # Return the first matching pixel position as (x, y)
+    y, x = divmod(flat_idx, mask.shape[1])
+    return x, y
+
+async def pixel_search(adb_interaction: ADBInteraction, device_id: str, target_color: Tuple[int, int, int], tolerance: int = 10,
+                       roi: Optional[Tuple[int, int, int, int]] = None) -> Optional[Tuple[int, int]]:
     """
     Capture a screenshot and search for a specific pixel color.
 
@@ -191,33 +790,29 @@ async def pixel_search(adb_interaction: ADBInteraction, device_id: str, target_c
     :param device_id: The ADB device ID.
     :param target_color: The RGB color to search for.
     :param tolerance: Allowed variation for color matching.
+    :param roi: Optional (x0, y0, x1, y1) region to search (full frame if None).
     :return: (x, y) coordinates if found, otherwise None.
     """
-    screenshot = await adb_interaction.take_screenshot(device_id, return_bitmap=True)
-    screenshot = screenshot.convert("RGB")
+    # Decode directly to BGR and compare in BGR: no PIL RGB conversion copy
+    screenshot_array = await adb_interaction.take_screenshot(device_id, return_bitmap="bgr_ndarray")
 
-    if screenshot is None:
+    if screenshot_array is None:
         logging.error("Error: Screenshot not available.")
         return None
 
-    screenshot_array = np.array(screenshot)  # Convert PIL image to NumPy array (RGB)
+    roi_x = roi_y = 0
+    if roi is not None:
+        roi_x, roi_y, roi_x1, roi_y1 = roi
+        screenshot_array = screenshot_array[roi_y:roi_y1, roi_x:roi_x1]
 
-    # Find all pixels that match the target color within the tolerance range
-    match_mask = np.all(
-        np.abs(screenshot_array - np.array(target_color)) <= tolerance,
-        axis=-1
-    )
-
-    # Get indices of matching pixels
-    matches = np.column_stack(np.where(match_mask))
-
-    if matches.size == 0:
+    target_bgr = (target_color[2], target_color[1], target_color[0])
+    match = await asyncio.to_thread(_pixel_search_sync, screenshot_array, target_bgr, tolerance)
+    if match is None:
         return None
+    return match[0] + roi_x, match[1] + roi_y
 
-    # Return the first matching pixel position
-    return tuple(matches[0][::-1])  # Convert (row, col) to (x, y)
-
-async def search_until_found_pixel(adb_interaction: ADBInteraction, device_id: str, target_color: Tuple[int, int, int], tolerance: int = 10, max_attempts: int = 100, delay: float = 0.1) -> Optional[Tuple[int, int]]:
+async def search_until_found_pixel(adb_interaction: ADBInteraction, device_id: str, target_color: Tuple[int, int, int], tolerance: int = 10, max_attempts: int = 100, delay: float = 0.1,
+                                   roi: Optional[Tuple[int, int, int, int]] = None) -> Optional[Tuple[int, int]]:
     """
     Repeatedly take screenshots and search for a specific pixel color until it's found or max attempts reached.
 
@@ -226,20 +821,21 @@ async def search_until_found_pixel(adb_interaction: ADBInteraction, device_id: s
     :param target_color: The RGB color to search for.
     :param tolerance: Allowed variation for color matching.
     :param max_attempts: Maximum number of attempts before giving up.
-    :param delay: Delay (in seconds) between attempts.
+    :param delay: Maximum delay (in seconds) between attempts.
     :return: (x, y) coordinates if found, otherwise None.
     """
     for attempt in range(max_attempts):
         logging.info(f"Attempt {attempt + 1}/{max_attempts}...")
 
-        match = await pixel_search(adb_interaction, device_id, target_color, tolerance)
+        match = await pixel_search(adb_interaction, device_id, target_color, tolerance, roi)
 
         if match is not None:
             x, y = match
             logging.info(f"Pixel found at ({x}, {y}) on attempt {attempt + 1}.")
             return x, y
 
-        await asyncio.sleep(delay)  # Wait before next attempt
+        # Exponential backoff capped at the configured delay
+        await asyncio.sleep(min(0.01 * (1.5 ** attempt), delay))
 
     logging.info("Pixel not found after max attempts.")
     return None
@@ -1,6 +1,7 @@
 import os
 import json
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from utils.config_loader import load_settings
 
 logging.basicConfig(level=logging.INFO)
@@ -50,12 +51,17 @@ def get_all_players() -> list:
         logging.error("Error: Invalid base path in settings.")
         return []
 
-    players_info = []
-    for folder in os.listdir(BASE_PATH):
-        vm_folder = os.path.join(BASE_PATH, folder)
-        if os.path.isdir(vm_folder):
-            player_info = get_player_info(vm_folder)
-            if player_info["playerName"] and player_info["adb_host_port"]:
-                players_info.append(player_info)
+    # scandir entries carry the dir flag from the directory read itself,
+    # so no extra stat per folder is needed
+    with os.scandir(BASE_PATH) as it:
+        vm_folders = [entry.path for entry in it if entry.is_dir()]
 
-    return players_info
\ No newline at end of file
+    if not vm_folders:
+        return []
+
+    # Reading two JSON files per VM is I/O-bound; fan the reads out so dozens
+    # of VM folders don't serialize 2N open/read calls
+    with ThreadPoolExecutor(max_workers=min(16, len(vm_folders))) as executor:
+        results = executor.map(get_player_info, vm_folders)
+
+    return [info for info in results if info["playerName"] and info["adb_host_port"]]
\ No newline at end of file
@@ -1,38 +1,53 @@
+import asyncio
 import logging
 import os
 import sys
 import subprocess
-from typing import Tuple
+import threading
+from typing import Dict, Optional, Tuple
 from utils.config_loader import load_settings
 
 logging.basicConfig(level=logging.INFO)
 
+# Parsed once at import; every ADBClient instance shares it (multi-device
+# setups construct several clients and the file never changes mid-run)
+_SETTINGS = load_settings()
+
 class ADBClient:
     """Class to execute ADB commands with superuser privileges if available."""
 
     def __init__(self):
         """Load ADB path from settings."""
-        self.settings = load_settings()
+        self.settings = _SETTINGS
         self.adb_path = os.getenv("ADB_PATH", self.settings.get("adb_path", ""))
         self.superuser_enabled = False  # Track if superuser is available
+        self._shells: Dict[str, subprocess.Popen] = {}  # Persistent per-device shell pipes
+        self._shell_locks: Dict[str, threading.Lock] = {}
 
         if not os.path.exists(self.adb_path):
             raise FileNotFoundError(f"ADB executable not found: {self.adb_path}")
 
-    def run_command(self, command: str) -> Tuple[str, str]:
+    def run_command(self, command) -> Tuple[str, str]:
         """
         Execute an ADB command, ensuring superuser access is applied correctly.
 
-        :param command: The ADB command to execute.
+        :param command: The ADB command as a string, or a pre-split argv list.
+                        List form passes arguments through verbatim — no
+                        whitespace splitting, so values may contain spaces.
         :return: A tuple containing the command's stdout and stderr output.
         """
-        is_shell_command = " shell " in command
+        if isinstance(command, str):
+            is_shell_command = " shell " in command
+
+            if self.superuser_enabled and is_shell_command:
+                if "su -c" not in command:
+                    command = command.replace("shell", 'shell su -c "', 1) + '"'
 
-        if self.superuser_enabled and is_shell_command:
-            if "su -c" not in command:
-                command = command.replace("shell", 'shell su -c "', 1) + '"'
+            args = command.split()
+        else:
+            args = list(command)
 
-        full_command = [self.adb_path] + command.split()
+        full_command = [self.adb_path] + args
         try:
             startupinfo = None
             if sys.platform == "win32":
@@ -55,6 +70,172 @@ class ADBClient:
             logging.error(f"Error executing ADB: {e}")
             return "", str(e)
 
+    def run_command_binary(self, command) -> bytes:
+        """
+        Execute an ADB command and return its raw stdout bytes.
+
+        Used for commands whose output is binary (e.g. `exec-out screencap`),
+        where text decoding would corrupt the stream.
+
+        :param command: The ADB command as a string or a pre-split argv list.
+        :return: The command's stdout as bytes (empty on failure).
+        """
+        args = command.split() if isinstance(command, str) else list(command)
+        full_command = [self.adb_path] + args
+        try:
+            startupinfo = None
+            if sys.platform == "win32":
+                startupinfo = subprocess.STARTUPINFO()
+                startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
+
+            result = subprocess.run(
+                full_command,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                startupinfo=startupinfo
+            )
+            if result.returncode != 0:
+                logging.error(f"ADB command failed: {result.stderr.decode(errors='replace').strip()}")
+                return b""
+            return result.stdout
+        except Exception as e:
+            logging.error(f"Error executing ADB: {e}")
+            return b""
+
+    async def run_command_binary_async(self, command: str) -> bytes:
+        """
+        Execute an ADB command on the event loop and return raw stdout bytes.
+
+        Uses asyncio's subprocess transport so the event loop keeps servicing
+        other device coroutines while the ADB round trip is in flight —
+        screenshot transfers from N devices overlap instead of queueing
+        behind a worker thread each. Falls back to the blocking variant in a
+        thread on loops without subprocess support (e.g. some Windows loops).
+
+        :param command: The ADB command as a string or a pre-split argv list.
+        :return: The command's stdout as bytes (empty on failure).
+        """
+        args = command.split() if isinstance(command, str) else list(command)
+        full_command = [self.adb_path] + args
+        try:
+            proc = await asyncio.create_subprocess_exec(
+                *full_command,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE
+            )
+        except NotImplementedError:
+            return await asyncio.to_thread(self.run_command_binary, command)
+        except Exception as e:
+            logging.error(f"Error executing ADB: {e}")
+            return b""
+
+        stdout, stderr = await proc.communicate()
+        if proc.returncode != 0:
+            logging.error(f"ADB command failed: {stderr.decode(errors='replace').strip()}")
+            return b""
+        return stdout
+
+    def _open_shell(self, device_id: str) -> Optional[subprocess.Popen]:
+        """
+        Spawn a persistent `adb shell` process for the device.
+
+        :param device_id: The ADB device ID.
+        :return: The shell process, or None if it could not be started.
+        """
+        try:
+            startupinfo = None
+            if sys.platform == "win32":
+                startupinfo = subprocess.STARTUPINFO()
+                startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
+
+            return subprocess.Popen(
+                [self.adb_path, "-s", device_id, "shell"],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+                text=True,
+                encoding="utf-8",
+                startupinfo=startupinfo
+            )
+        except Exception as e:
+            logging.error(f"Error opening persistent shell for {device_id}: {e}")
+            return None
+
+    def run_shell_command(self, device_id: str, command: str) -> Tuple[str, str]:
+        """
+        Run a device shell command through a persistent `adb shell` pipe.
+
+        A fresh adb client process costs a fork/exec plus a handshake with the
+        adb server (~10-30ms) on every call; high-frequency commands like
+        `input tap` go through one long-lived shell per device instead. The
+        command is terminated by an `echo __END__$?` sentinel so the reader
+        knows where its output ends and whether the command succeeded. A
+        dead pipe is respawned once before giving up.
+
+        :param device_id: The ADB device ID.
+        :param command: The shell command to run on the device (no `adb shell` prefix).
+        :return: A tuple containing the command's output and an error string
+                 (non-empty when the command exited non-zero).
+        """
+        if self.superuser_enabled:
+            command = f'su -c "{command}"'
+
+        lock = self._shell_locks.setdefault(device_id, threading.Lock())
+        with lock:
+            for attempt in range(2):
+                proc = self._shells.get(device_id)
+                if proc is None or proc.poll() is not None:
+                    proc = self._open_shell(device_id)
+                    if proc is None:
+                        return "", "failed to open persistent shell"
+                    self._shells[device_id] = proc
+                try:
+                    proc.stdin.write(command + "; echo __END__$?\n")
+                    proc.stdin.flush()
+                    lines = []
+                    while True:
+                        line = proc.stdout.readline()
+                        if not line:
+                            raise BrokenPipeError("adb shell pipe closed")
+                        line = line.rstrip("\r\n")
+                        if line.startswith("__END__"):
+                            output = "\n".join(lines).strip()
+                            status_text = line[len("__END__"):]
+                            status = int(status_text) if status_text.lstrip("-").isdigit() else 0
+                            if status != 0:
+                                # stderr is merged into the pipe, so the
+                                # collected output is the error text
+                                error = output or f"exit status {status}"
+                                return output, f"exit status {status}: {error}" if output else error
+                            return output, ""
+                        lines.append(line)
+                except (BrokenPipeError, OSError) as e:
+                    proc.kill()
+                    self._shells.pop(device_id, None)
+                    if attempt:
+                        logging.error(f"Persistent shell failed for {device_id}: {e}")
+                        return "", str(e)
+        return "", "unreachable"
+
+    def close_shells(self) -> None:
+        """
+        Shut down the persistent per-device shell pipes.
+
+        Sends `exit` so each shell terminates cleanly, then waits briefly and
+        kills any that linger. Safe to call repeatedly.
+        """
+        for device_id, proc in list(self._shells.items()):
+            lock = self._shell_locks.setdefault(device_id, threading.Lock())
+            with lock:
+                if proc.poll() is None:
+                    try:
+                        proc.stdin.write("exit\n")
+                        proc.stdin.flush()
+                        proc.wait(timeout=1)
+                    except (BrokenPipeError, OSError, subprocess.TimeoutExpired):
+                        proc.kill()
+                self._shells.pop(device_id, None)
+
     def is_device_connected(self, port: int) -> bool:
         """
         Check if the ADB port is already connected.
@@ -1,162 +1,382 @@
+import base64
+import hashlib
+import io
+import itertools
 import logging
 import os
-import hashlib
+import pathlib
 import asyncio
 import time
+import cv2
+import numpy as np
+from collections import OrderedDict
+from contextlib import asynccontextmanager
 from PIL import Image
 from utils.adb_client import ADBClient
 
+try:
+    import xxhash
+except ImportError:  # xxhash is optional; blake2b is the stdlib fallback
+    xxhash = None
+
 logging.basicConfig(level=logging.INFO)
 
+def _frame_digest(data: bytes) -> bytes:
+    """Equality-only digest of a captured frame (not a security hash).
+
+    xxh3 runs an order of magnitude faster than cryptographic hashes on a
+    ~10MB raw framebuffer, which matters at polling rates.
+    """
+    if xxhash is not None:
+        return xxhash.xxh3_128_digest(data)
+    return hashlib.blake2b(data, digest_size=16).digest()
+
+# Created once at import; every ADBInteraction instance shares it, so
+# constructing one per device doesn't repeat the mkdir/stat
+_SCREENSHOT_DIR = pathlib.Path(os.getcwd()) / "temp"
+_SCREENSHOT_DIR.mkdir(exist_ok=True)
+
+class _BatchQueue:
+    """Records input commands for ADBInteraction.batched to flush in one round trip."""
+
+    def __init__(self):
+        self.commands = []
+
+    def simulate_tap(self, x: int, y: int):
+        """Queue a tap at the specified (x, y) coordinates."""
+        self.commands.append(f"input tap {x} {y}")
+
+    def simulate_swipe(self, x1: int, y1: int, x2: int, y2: int, duration: int = 500):
+        """Queue a swipe from (x1, y1) to (x2, y2) over the specified duration in milliseconds."""
+        self.commands.append(f"input swipe {x1} {y1} {x2} {y2} {duration}")
+
+    def simulate_string(self, string: str):
+        """Queue a text input."""
+        self.commands.append(f"input text {string}")
+
 class ADBInteraction:
     """Class to interact with ADB devices for simulated input, screenshots, and app management."""
 
     def __init__(self, adb_client: ADBClient):
         """Initialize with an instance of ADBClient."""
         self.adb_client = adb_client
-        self.screenshot_dir = os.path.join(os.getcwd(), "temp")
-        os.makedirs(self.screenshot_dir, exist_ok=True)
+        self.screenshot_dir = _SCREENSHOT_DIR
+        self._filename_counter = itertools.count()
+        # Small per-device LRU of decoded frames keyed by (byte digest,
+        # decode mode). Polling callers often capture identical frames back
+        # to back — and A-B-A toggles like blinking UI — so a few entries
+        # catch both without re-decoding.
+        self._frame_cache = {}
+        # Formatted am start/force-stop command strings, keyed by their
+        # arguments — the same app is relaunched many times per session
+        self._app_cmd_cache = {}
+        # Devices whose adbd lacks a working exec-out; remembered so the
+        # failed probe is paid once, not per capture
+        self._png_fallback_devices = set()
+        # Reusable per-device BGR output buffer: same-resolution captures
+        # convert into it instead of allocating a fresh ~6MB array each time
+        self._scratch_bgr = {}
 
-    def _run_command(self, command: str):
-        """Run an ADB command and handle errors."""
+    def _run_command(self, command):
+        """Run an ADB command (string or argv list) and handle errors."""
         output, error = self.adb_client.run_command(command)
         if error:
             logging.error(f"Error running command '{command}': {error}")
             return None
         return output
 
-    def simulate_tap(self, device_id: str, x: int, y: int):
+    def _run_shell(self, device_id: str, command: str):
+        """Run a device shell command over the persistent per-device pipe."""
+        output, error = self.adb_client.run_shell_command(device_id, command)
+        if error:
+            logging.error(f"Error running shell command '{command}' on {device_id}: {error}")
+            return None
+        return output
+
+    async def batch_shell(self, device_id: str, commands: list):
+        """
+        Run several device shell commands in one round trip.
+
+        The commands are joined with ';' and sent through the persistent
+        shell pipe as a single write, so a scripted sequence of N inputs
+        costs one round trip instead of N.
+        """
+        if not commands:
+            return None
+        return await asyncio.to_thread(self._run_shell, device_id, "; ".join(commands))
+
+    @asynccontextmanager
+    async def batched(self, device_id: str):
+        """
+        Queue input simulations and flush them in one shell round trip.
+
+        Usage::
+
+            async with adb.batched(device_id) as q:
+                q.simulate_tap(100, 200)
+                q.simulate_tap(300, 400)
+        """
+        queue = _BatchQueue()
+        try:
+            yield queue
+        finally:
+            await self.batch_shell(device_id, queue.commands)
+
+    async def simulate_tap(self, device_id: str, x: int, y: int):
         """Simulate a tap at the specified (x, y) coordinates on the device."""
-        command = f"-s {device_id} shell input tap {x} {y}"
-        return self._run_command(command)
+        # The pipe round trip blocks on the on-device input binary (tens to
+        # hundreds of ms); run it in a worker thread so the event loop — and
+        # with it the GUI and every other device's coroutine — keeps moving
+        return await asyncio.to_thread(self._run_shell, device_id, f"input tap {x} {y}")
 
-    def simulate_swipe(self, device_id: str, x1: int, y1: int, x2: int, y2: int, duration: int = 500):
+    async def simulate_swipe(self, device_id: str, x1: int, y1: int, x2: int, y2: int, duration: int = 500):
         """Simulate a swipe from (x1, y1) to (x2, y2) over the specified duration in milliseconds."""
-        command = f"-s {device_id} shell input swipe {x1} {y1} {x2} {y2} {duration}"
-        return self._run_command(command)
+        return await asyncio.to_thread(self._run_shell, device_id, f"input swipe {x1} {y1} {x2} {y2} {duration}")
 
-    def simulate_string(self, device_id: str, string: str):
+    async def simulate_string(self, device_id: str, string: str):
         """Simulate a text input on the device."""
-        command = f"-s {device_id} shell input text {string}"
-        return self._run_command(command)
+        return await asyncio.to_thread(self._run_shell, device_id, f"input text {string}")
 
-    def _generate_hashed_filename(self) -> str:
-        """Generate a unique hashed filename for the screenshot."""
-        timestamp = str(time.time()).encode()
-        hash_object = hashlib.sha256(timestamp)
-        return f"{hash_object.hexdigest()}.png"
+    def _generate_temp_filename(self) -> str:
+        """Generate a unique filename for the screenshot."""
+        # Nanosecond timestamp plus a per-instance counter is already unique;
+        # hashing it (previously SHA-256) added cost and 64-char names for
+        # no extra uniqueness
+        return f"{time.time_ns():x}_{next(self._filename_counter):x}.png"
 
-    async def wait_for_valid_png(self, file_path, timeout=5, interval=0.1):
-        elapsed_time = 0
+    async def take_screenshot(self, device_id: str, return_bitmap=False):
+        """
+        Capture a screenshot in a single ADB round trip.
 
-        while elapsed_time < timeout:
-            if os.path.exists(file_path) and os.path.getsize(file_path) > 0:
-                try:
-                    with Image.open(file_path) as img:
-                        img.verify()
-                    return True
-                except (OSError, IOError):
-                    pass
+        In-memory modes — True (PIL Image) or "bgr_ndarray" (BGR NumPy
+        array) — transfer the raw framebuffer, skipping both the on-device
+        PNG encode and the host-side decode. When False, `screencap -p`
+        PNG bytes are written once to the temp directory and the path is
+        returned.
+        """
+        if return_bitmap:
+            # Raw framebuffer: larger transfer, but no zlib compress on the
+            # device and no libpng decode here — just a header parse + memcpy
+            data = await self.adb_client.run_command_binary_async(f"-s {device_id} exec-out screencap")
+            if len(data) < 16:
+                logging.error(f"Failed to capture raw screenshot on device {device_id}")
+                return None
 
-            await asyncio.sleep(interval)
-            elapsed_time += interval
+            def _digest_and_decode():
+                # Unchanged frame bytes decode to an identical image — return
+                # the cached one and skip the conversion entirely
+                cache = self._frame_cache.setdefault(device_id, OrderedDict())
+                key = (_frame_digest(data), return_bitmap)
+                image = cache.get(key)
+                if image is not None:
+                    cache.move_to_end(key)
+                    return image
 
-        return False
+                rgba = self._decode_raw_screencap(data, device_id)
+                if rgba is None:
+                    return None
 
-    async def take_screenshot(self, device_id: str, return_bitmap: bool = False):
-        """
-        Capture a screenshot, save it in the temp directory, and return its path or bitmap image.
-        """
-        remote_path = "/sdcard/screen.png"
-        capture_command = f"-s {device_id} shell screencap {remote_path}"
+                if return_bitmap == "bgr_ndarray":
+                    scratch = self._scratch_bgr.get(device_id)
+                    if scratch is None or scratch.shape[:2] != rgba.shape[:2]:
+                        scratch = self._scratch_bgr[device_id] = np.empty(
+                            (rgba.shape[0], rgba.shape[1], 3), np.uint8
+                        )
+                    else:
+                        # Cached BGR entries alias the scratch we are about to
+                        # overwrite; drop them so the LRU never serves stale
+                        # pixels
+                        for stale in [k for k in cache if k[1] == "bgr_ndarray"]:
+                            del cache[stale]
+                    image = cv2.cvtColor(rgba, cv2.COLOR_RGBA2BGR, dst=scratch)
+                else:
+                    # frombuffer shares the capture's own bytes — no pixel
+                    # copy, and each capture owns its buffer so cached images
+                    # stay valid
+                    image = Image.frombuffer(
+                        "RGBA", (rgba.shape[1], rgba.shape[0]), rgba, "raw", "RGBA", 0, 1
+                    )
+                cache[key] = image
+                if len(cache) > 4:
+                    cache.popitem(last=False)
+                return image
+
+            # Hashing ~4MB and converting pixels takes milliseconds — off the
+            # event loop so GUI updates and other devices keep flowing
+            return await asyncio.to_thread(_digest_and_decode)
+
+        data = await self.take_screenshot_bytes(device_id)
+        if not data:
+            return None
 
+        filename = self._generate_temp_filename()
+        save_path = str(self.screenshot_dir / filename)
         try:
-            # Execute the screenshot command
-            self._run_command(capture_command)
-        except Exception as e:
-            logging.error(f"Failed to capture screenshot on device {device_id}: {e}")
+            with open(save_path, "wb") as f:
+                f.write(data)
+        except OSError as e:
+            logging.error(f"Failed to save screenshot to {save_path}: {e}")
             return None
+        return save_path
 
-        filename = self._generate_hashed_filename()
-        save_path = os.path.join(self.screenshot_dir, filename)
+    async def take_screenshots_parallel(self, device_ids: list, return_bitmap=False) -> dict:
+        """
+        Capture screenshots from several devices concurrently.
 
-        try:
-            # Pull the screenshot from the device
-            self.pull(device_id, remote_path, save_path)
-        except Exception as e:
-            logging.error(f"Failed to pull screenshot from {remote_path} to {save_path}: {e}")
+        Each capture is one awaited ADB round trip, so gathering them runs
+        the transfers in parallel: wall time is the slowest device rather
+        than the sum of all of them.
+
+        :param device_ids: The ADB device IDs to capture.
+        :param return_bitmap: Passed through to take_screenshot per device.
+        :return: Mapping of device ID to take_screenshot's result.
+        """
+        results = await asyncio.gather(
+            *(self.take_screenshot(device_id, return_bitmap) for device_id in device_ids)
+        )
+        return dict(zip(device_ids, results))
+
+    async def take_screenshot_bytes(self, device_id: str) -> bytes:
+        """
+        Capture a screenshot as PNG bytes in one ADB round trip.
+
+        Prefers `exec-out screencap -p`; devices whose adbd mangles exec-out
+        binary streams fall back to piping the PNG through base64 over the
+        shell — still a single round trip with no on-device file. Callers can
+        hash or decode the bytes directly.
+
+        :param device_id: The ADB device ID.
+        :return: PNG bytes, or b"" on failure.
+        """
+        if device_id not in self._png_fallback_devices:
+            data = await self.adb_client.run_command_binary_async(f"-s {device_id} exec-out screencap -p")
+            if data.startswith(b"\x89PNG"):
+                return data
+            if not data:
+                # Nothing came back at all — a transient failure (device
+                # offline, adb restart), not evidence that adbd mangles
+                # exec-out, so don't latch the slower fallback permanently
+                logging.error(f"exec-out screencap returned no data on device {device_id}")
+                return b""
+            logging.info(f"exec-out screencap unusable on device {device_id}, using base64 pipe")
+            self._png_fallback_devices.add(device_id)
+
+        output, error = await asyncio.to_thread(
+            self.adb_client.run_shell_command, device_id, "screencap -p | toybox base64"
+        )
+        if error:
+            logging.error(f"Failed to capture screenshot bytes on device {device_id}: {error}")
+            return b""
+        # b64decode skips the line breaks the shell inserts
+        data = base64.b64decode(output)
+        if not data.startswith(b"\x89PNG"):
+            logging.error(f"Failed to capture screenshot bytes on device {device_id}")
+            return b""
+        return data
+
+    def _decode_raw_screencap(self, data: bytes, device_id: str):
+        """
+        Parse a raw `screencap` buffer into an HxWx4 RGBA array (no copy).
+
+        :param data: The raw stdout bytes of `exec-out screencap`.
+        :param device_id: The ADB device ID (for error logging).
+        :return: RGBA NumPy array viewing the buffer, or None on failure.
+        """
+        width = int.from_bytes(data[0:4], "little")
+        height = int.from_bytes(data[4:8], "little")
+        pixel_bytes = width * height * 4
+
+        # Header is 12 bytes (w, h, format) on older Android, 16 with colorspace
+        header_size = len(data) - pixel_bytes
+        if width <= 0 or height <= 0 or header_size not in (12, 16):
+            logging.error(f"Unexpected screencap buffer from device {device_id} ({len(data)} bytes)")
             return None
-        finally:
-            # Ensure remote file is removed even if pull fails
-            try:
-                self.remove(device_id, remote_path, recursive=False)
-            except Exception as e:
-                logging.warning(f"Failed to remove remote screenshot file {remote_path}: {e}")
 
-        if return_bitmap:
-            try:
-                # Ensure the PNG file is fully saved before loading
-                if not await self.wait_for_valid_png(save_path):
-                    logging.error(f"Image save failed or is incomplete: {save_path}")
-                    return None
+        buffer = np.frombuffer(data, np.uint8, count=pixel_bytes, offset=header_size)
+        return buffer.reshape(height, width, 4)
 
-                # Load the image safely
-                image = Image.open(save_path)
-                image.load()
-                return image
-            except Exception as e:
-                logging.error(f"Error loading image from {save_path}: {e}")
-                return None
-            finally:
-                # Ensure local file cleanup
-                try:
-                    os.remove(save_path)
-                except Exception as e:
-                    logging.warning(f"Failed to delete local file {save_path}: {e}")
+    async def take_screenshot_raw(self, device_id: str, grayscale: bool = False):
+        """
+        Capture a screenshot as a raw RGBA framebuffer via `exec-out screencap`.
 
-        return save_path
+        Avoids the on-device PNG encode and host-side decode entirely; the raw
+        transfer is faster despite the larger byte count.
+
+        :param device_id: The ADB device ID.
+        :param grayscale: Return a grayscale array instead of BGR.
+        :return: NumPy array (HxW or HxWx3), or None on failure.
+        """
+        data = await self.adb_client.run_command_binary_async(f"-s {device_id} exec-out screencap")
+        if len(data) < 16:
+            logging.error(f"Failed to capture raw screenshot on device {device_id}")
+            return None
+
+        buffer = self._decode_raw_screencap(data, device_id)
+        if buffer is None:
+            return None
+        if grayscale:
+            return cv2.cvtColor(buffer, cv2.COLOR_RGBA2GRAY)
+        return cv2.cvtColor(buffer, cv2.COLOR_RGBA2BGR)
 
     # Temp sync function. Not used in the final code.
     def take_screenshot_(self, device_id: str, return_bitmap: bool = False):
         """Capture a screenshot, save it in the temp directory, and return its path or bitmap image."""
-        remote_path = "/sdcard/screen.png"
+        # /data/local/tmp skips the FUSE layer that backs /sdcard, and
+        # screencap overwrites the file, so no rm round trip is needed —
+        # the next capture truncates it
+        remote_path = "/data/local/tmp/screen.png"
         capture_command = f"-s {device_id} shell screencap {remote_path}"
         self._run_command(capture_command)
 
-        filename = self._generate_hashed_filename()
-        save_path = os.path.join(self.screenshot_dir, filename)
+        filename = self._generate_temp_filename()
+        save_path = str(self.screenshot_dir / filename)
         self.pull(device_id, remote_path, save_path)
-        self.remove(device_id, remote_path, recursive=False)
 
         if return_bitmap:
-            while not os.path.exists(save_path):
-                time.sleep(0.1)
+            # pull blocks until the transfer is done, so the file is complete
+            # here. Read it once, drop it immediately, and decode from memory
+            # so PIL never seeks back to disk during load().
             try:
-                image = Image.open(save_path)
+                with open(save_path, "rb") as f:
+                    buf = f.read()
+            except OSError as e:
+                logging.error(f"Error reading pulled screenshot: {e}")
+                return None
+            os.remove(save_path)
+
+            try:
+                image = Image.open(io.BytesIO(buf))
                 image.load()
             except Exception as e:
                 logging.error(f"Error loading image: {e}")
                 return None
-            finally:
-                os.remove(save_path)
             return image
 
         return save_path
 
     def start_app(self, device_id: str, package_name: str, activity_name: str):
         """Start an application on the device using its package name and activity name."""
-        command = f"-s {device_id} shell am start -n {package_name}/{activity_name}"
-        return self._run_command(command)
+        key = ("start", package_name, activity_name)
+        command = self._app_cmd_cache.get(key)
+        if command is None:
+            command = self._app_cmd_cache[key] = f"am start -n {package_name}/{activity_name}"
+        return self._run_shell(device_id, command)
 
     def close_app(self, device_id: str, package_name: str):
         """Close an application on the device using its package name."""
-        command = f"-s {device_id} shell am force-stop {package_name}"
-        return self._run_command(command)
+        key = ("stop", package_name)
+        command = self._app_cmd_cache.get(key)
+        if command is None:
+            command = self._app_cmd_cache[key] = f"am force-stop {package_name}"
+        return self._run_shell(device_id, command)
+
+    def close(self):
+        """Shut down the persistent shell pipes held by the underlying client."""
+        self.adb_client.close_shells()
 
     def is_app_running(self, device_id: str, package: str) -> bool:
         """Check if an app (identified by its package name) is running on the device."""
-        command = f"-s {device_id} shell pidof {package}"
-        output = self._run_command(command)
+        output = self._run_shell(device_id, f"pidof {package}")
 
         if output is None or not output.strip():
             return False
@@ -165,22 +385,18 @@ class ADBInteraction:
     def remove(self, device_id: str, path: str, recursive: bool):
         """Remove a file or directory on the device."""
         if recursive:
-            command = f"-s {device_id} shell rm -rf {path}"
-        else:
-            command = f"-s {device_id} shell rm {path}"
-        return self._run_command(command)
+            return self._run_shell(device_id, f"rm -rf {path}")
+        return self._run_shell(device_id, f"rm {path}")
 
     def copy(self, device_id: str, src: str, dest: str):
         """Copy files from one location to another on the device."""
-        command = f"-s {device_id} shell cp {src} {dest}"
-        return self._run_command(command)
+        return self._run_shell(device_id, f"cp {src} {dest}")
 
     def pull(self, device_id: str, src: str, dest: str):
         """Pull files from the device to the local machine."""
-        command = f"-s {device_id} pull {src} {dest}"
-        return self._run_command(command)
+        # argv form: paths pass through verbatim, no whitespace splitting
+        return self._run_command(["-s", device_id, "pull", src, dest])
 
     def push(self, device_id: str, src: str, dest: str):
         """Push files from the local machine to the device."""
-        command = f"-s {device_id} push {src} {dest}"
-        return self._run_command(command)
\ No newline at end of file
+        return self._run_command(["-s", device_id, "push", src, dest])
\ No newline at end of file
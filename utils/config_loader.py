@@ -3,6 +3,11 @@ import os
 import sys
 import logging
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; stdlib json is the fallback
+    orjson = None
+
 logging.basicConfig(level=logging.INFO)
 
 if getattr(sys, 'frozen', False):
@@ -12,17 +17,43 @@ else:
 
 SETTINGS_FILE = os.path.join(base_path, "config.json")
 
+# Parsed settings memo: (mtime_ns, size) of the file it was parsed from.
+# Re-parsing only happens when the file actually changes; unchanged calls
+# cost one stat instead of a full open + json.load.
+_cache_stamp = None
+_cache_value: dict = {}
+
 def load_settings() -> dict:
     """
     Load settings from the config.json file.
 
+    The parsed result is memoized against the file's mtime and size, so
+    repeated calls re-read the file only after it has been modified.
+
     :return: Dictionary containing settings.
     """
+    global _cache_stamp, _cache_value
+
+    try:
+        stat = os.stat(SETTINGS_FILE)
+    except FileNotFoundError:
+        logging.error(f"Error: '{SETTINGS_FILE}' not found.")
+        return {}
+
+    stamp = (stat.st_mtime_ns, stat.st_size)
+    if stamp == _cache_stamp:
+        return _cache_value
+
     try:
-        with open(SETTINGS_FILE, "r", encoding="utf-8") as f:
-            return json.load(f)
+        # Read as bytes: both parsers decode UTF-8 themselves, so a text-mode
+        # handle would decode the payload twice
+        with open(SETTINGS_FILE, "rb") as f:
+            data = f.read()
+        _cache_value = orjson.loads(data) if orjson is not None else json.loads(data)
+        _cache_stamp = stamp
+        return _cache_value
     except FileNotFoundError:
         logging.error(f"Error: '{SETTINGS_FILE}' not found.")
-    except json.JSONDecodeError:
+    except ValueError:  # JSONDecodeError from either parser
         logging.error(f"Error: Failed to parse '{SETTINGS_FILE}'.")
     return {}
\ No newline at end of file